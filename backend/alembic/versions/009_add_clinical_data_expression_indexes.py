@@ -0,0 +1,42 @@
+"""Add expression B-tree indexes on hot numeric clinical_data keys.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+
+The GIN/containment path cannot serve ``->>`` range comparisons, so filters
+such as "age > 50" scan every participant. jsonb_numeric() is an IMMUTABLE
+safe cast (non-numeric text -> NULL) so the index build and later inserts
+never fail on malformed ODK values.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        r"""
+        CREATE OR REPLACE FUNCTION jsonb_numeric(val text) RETURNS numeric
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT CASE
+                WHEN val ~ '^\s*[-+]?[0-9]+(\.[0-9]+)?\s*$' THEN val::numeric
+            END
+        $$
+        """
+    )
+    op.execute(
+        "CREATE INDEX ix_participant_age ON participant "
+        "(jsonb_numeric(clinical_data #>> '{demographics,age}'))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_participant_age")
+    op.execute("DROP FUNCTION IF EXISTS jsonb_numeric(text)")
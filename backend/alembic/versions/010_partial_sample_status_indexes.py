@@ -0,0 +1,41 @@
+"""Replace full sample status index with partial indexes on active samples.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+
+Operational queries filter on in-flight statuses; depleted/discarded rows are
+the long tail of history. Indexes are built CONCURRENTLY so the hot sample
+table is not locked against writes during the migration.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_sample_status_active "
+            "ON sample (status) WHERE status NOT IN ('discarded', 'depleted')"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_sample_pending_discard "
+            "ON sample (participant_id) WHERE status = 'pending_discard'"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_sample_status")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_sample_status ON sample (status)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_sample_pending_discard")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_sample_status_active")
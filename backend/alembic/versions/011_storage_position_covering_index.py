@@ -0,0 +1,40 @@
+"""Covering index on storage_position(box_id) for box-layout reads.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+
+INCLUDE (row, column, sample_id, occupied_at) lets the box grid be served by
+an index-only scan. A lower autovacuum scale factor keeps pages marked
+all-visible as sample_id churns, which index-only scans depend on.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_position_box_covering "
+            'ON storage_position (box_id) INCLUDE ("row", "column", sample_id, occupied_at)'
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_position_box")
+    op.execute(
+        "ALTER TABLE storage_position SET (autovacuum_vacuum_scale_factor = 0.02)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE storage_position RESET (autovacuum_vacuum_scale_factor)")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_position_box ON storage_position (box_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_position_box_covering")
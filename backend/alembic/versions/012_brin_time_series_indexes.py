@@ -0,0 +1,48 @@
+"""Replace B-tree timestamp indexes on append-only tables with BRIN.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+
+Temperature events, ODK sync logs, partner imports and sample status history
+are inserted in roughly chronological order, so a BRIN summary per 32 pages
+gives comparable range-scan performance at a fraction of the B-tree size and
+write cost.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, old btree index, new brin index)
+BRIN_INDEXES = [
+    ("freezer_temperature_event", "event_start", "ix_temp_event_start", "ix_temp_event_start_brin"),
+    ("odk_sync_log", "sync_started_at", "ix_odk_sync_log_started", "ix_odk_sync_log_started_brin"),
+    ("partner_lab_import", "import_date", "ix_partner_import_date", "ix_partner_import_date_brin"),
+    (
+        "sample_status_history",
+        "changed_at",
+        "ix_sample_status_history_changed_at",
+        "ix_sample_status_history_changed_at_brin",
+    ),
+]
+
+
+def upgrade() -> None:
+    for table, column, old_name, new_name in BRIN_INDEXES:
+        op.execute(
+            f"CREATE INDEX {new_name} ON {table} USING brin ({column}) "
+            "WITH (pages_per_range = 32)"
+        )
+        op.execute(f"DROP INDEX IF EXISTS {old_name}")
+
+
+def downgrade() -> None:
+    for table, column, old_name, new_name in BRIN_INDEXES:
+        op.execute(f"CREATE INDEX {old_name} ON {table} ({column})")
+        op.execute(f"DROP INDEX IF EXISTS {new_name}")
@@ -0,0 +1,98 @@
+"""Denormalize rack_id / freezer_id onto storage_position.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+
+Locating a sample's freezer previously required position -> box -> rack ->
+freezer. The copied keys are backfilled here and kept in sync by triggers:
+moving a box to another rack, or a rack to another freezer, rewrites the
+affected positions.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "storage_position",
+        sa.Column("rack_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("storage_rack.id"), nullable=True),
+    )
+    op.add_column(
+        "storage_position",
+        sa.Column("freezer_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("freezer.id"), nullable=True),
+    )
+
+    op.execute(
+        """
+        UPDATE storage_position sp
+        SET rack_id = b.rack_id, freezer_id = r.freezer_id
+        FROM storage_box b
+        JOIN storage_rack r ON b.rack_id = r.id
+        WHERE sp.box_id = b.id
+        """
+    )
+    op.alter_column("storage_position", "rack_id", nullable=False)
+    op.alter_column("storage_position", "freezer_id", nullable=False)
+    op.create_index("ix_position_freezer", "storage_position", ["freezer_id"])
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION storage_box_sync_position_location() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE storage_position
+            SET rack_id = NEW.rack_id,
+                freezer_id = (SELECT freezer_id FROM storage_rack WHERE id = NEW.rack_id)
+            WHERE box_id = NEW.id;
+            RETURN NEW;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_storage_box_rack_change
+        AFTER UPDATE OF rack_id ON storage_box
+        FOR EACH ROW WHEN (OLD.rack_id IS DISTINCT FROM NEW.rack_id)
+        EXECUTE FUNCTION storage_box_sync_position_location()
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION storage_rack_sync_position_freezer() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE storage_position SET freezer_id = NEW.freezer_id WHERE rack_id = NEW.id;
+            RETURN NEW;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_storage_rack_freezer_change
+        AFTER UPDATE OF freezer_id ON storage_rack
+        FOR EACH ROW WHEN (OLD.freezer_id IS DISTINCT FROM NEW.freezer_id)
+        EXECUTE FUNCTION storage_rack_sync_position_freezer()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_storage_rack_freezer_change ON storage_rack")
+    op.execute("DROP FUNCTION IF EXISTS storage_rack_sync_position_freezer()")
+    op.execute("DROP TRIGGER IF EXISTS trg_storage_box_rack_change ON storage_box")
+    op.execute("DROP FUNCTION IF EXISTS storage_box_sync_position_location()")
+    op.drop_index("ix_position_freezer", table_name="storage_position")
+    op.drop_column("storage_position", "freezer_id")
+    op.drop_column("storage_position", "rack_id")
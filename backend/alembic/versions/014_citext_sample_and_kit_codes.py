@@ -0,0 +1,50 @@
+"""Store sample_code / kit_code as citext; hash index for kit_code lookups.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-17
+
+Barcodes are scanned with sporadic case variation. citext makes equality
+case-insensitive while still using an index. sample_code keeps its unique
+constraint (whose B-tree serves equality), so the redundant ix_sample_code is
+dropped; kit_code has no unique constraint and gets a hash index, since kit
+scans are always equality lookups.
+
+gin_trgm_ops does not accept citext, so the fuzzy-search index is rebuilt on
+(sample_code::text) and search queries cast to text to match it.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+
+    op.execute("DROP INDEX IF EXISTS ix_sample_code_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_sample_code")
+    op.execute("ALTER TABLE sample ALTER COLUMN sample_code TYPE citext USING sample_code::citext")
+    op.execute(
+        "CREATE INDEX ix_sample_code_trgm ON sample USING gin ((sample_code::text) gin_trgm_ops)"
+    )
+
+    op.execute("ALTER TABLE stool_kit ALTER COLUMN kit_code TYPE citext USING kit_code::citext")
+    op.execute("CREATE INDEX ix_stool_kit_code_hash ON stool_kit USING hash (kit_code)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_stool_kit_code_hash")
+    op.execute("ALTER TABLE stool_kit ALTER COLUMN kit_code TYPE VARCHAR(100)")
+
+    op.execute("DROP INDEX IF EXISTS ix_sample_code_trgm")
+    op.execute("ALTER TABLE sample ALTER COLUMN sample_code TYPE VARCHAR(30)")
+    op.execute("CREATE INDEX ix_sample_code ON sample (sample_code)")
+    op.execute(
+        "CREATE INDEX ix_sample_code_trgm ON sample USING gin (sample_code gin_trgm_ops)"
+    )
@@ -0,0 +1,64 @@
+"""Store dashboard_cache.cache_data and odk_form_config.field_mapping as msgpack BYTEA.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-17
+
+Both payloads are written rarely and read whole, never queried into with
+JSONB operators, so MessagePack in BYTEA is cheaper to decode than JSONB.
+cache_data is LZ4-compressed in TOAST and toasted early (target 128 bytes)
+so the small fixed columns stay dense in the heap.
+"""
+
+import json
+from typing import Sequence, Union
+
+import msgpack
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    ("dashboard_cache", "cache_data"),
+    ("odk_form_config", "field_mapping"),
+]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for table, column in COLUMNS:
+        op.add_column(table, sa.Column(f"{column}_packed", sa.LargeBinary, nullable=True))
+        rows = conn.execute(text(f"SELECT id, {column} FROM {table}")).all()
+        for row_id, value in rows:
+            if isinstance(value, str):
+                value = json.loads(value)
+            conn.execute(
+                text(f"UPDATE {table} SET {column}_packed = :packed WHERE id = :id"),
+                {"packed": msgpack.packb(value, use_bin_type=True), "id": row_id},
+            )
+        op.drop_column(table, column)
+        op.alter_column(table, f"{column}_packed", new_column_name=column, nullable=False)
+
+    op.execute("ALTER TABLE dashboard_cache ALTER COLUMN cache_data SET COMPRESSION lz4")
+    op.execute("ALTER TABLE dashboard_cache SET (toast_tuple_target = 128)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE dashboard_cache RESET (toast_tuple_target)")
+    conn = op.get_bind()
+    for table, column in COLUMNS:
+        op.add_column(table, sa.Column(f"{column}_json", postgresql.JSONB, nullable=True))
+        rows = conn.execute(text(f"SELECT id, {column} FROM {table}")).all()
+        for row_id, packed in rows:
+            conn.execute(
+                text(f"UPDATE {table} SET {column}_json = CAST(:value AS JSONB) WHERE id = :id"),
+                {"value": json.dumps(msgpack.unpackb(packed, raw=False)), "id": row_id},
+            )
+        op.drop_column(table, column)
+        op.alter_column(table, f"{column}_json", new_column_name=column, nullable=False)
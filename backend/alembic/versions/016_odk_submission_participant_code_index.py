@@ -0,0 +1,29 @@
+"""Index odk_submission.participant_code_raw for participant-code lookups.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-17
+
+The participant code extracted from each submission is already stored in its
+own column, so a plain B-tree on it is far smaller than any GIN over the
+submission_data JSONB.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_odk_submission_participant_code_raw", "odk_submission", ["participant_code_raw"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_odk_submission_participant_code_raw", table_name="odk_submission")
@@ -0,0 +1,38 @@
+"""Unique (partner_name, alias_name) on test_name_alias.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-17
+
+Gives INSERT ... ON CONFLICT DO NOTHING a conflict target so alias warmup no
+longer needs a SELECT per alias. Existing duplicates (same partner and alias
+text) are collapsed to the oldest row first; nothing references alias rows.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM test_name_alias a
+        USING test_name_alias b
+        WHERE a.partner_name = b.partner_name
+          AND a.alias_name = b.alias_name
+          AND (a.created_at, a.id) > (b.created_at, b.id)
+        """
+    )
+    op.create_unique_constraint(
+        "uq_alias_partner_name", "test_name_alias", ["partner_name", "alias_name"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_alias_partner_name", "test_name_alias", type_="unique")
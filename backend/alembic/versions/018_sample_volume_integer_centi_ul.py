@@ -0,0 +1,43 @@
+"""Store sample volumes as integer hundredths of a microlitre.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-17
+
+Replaces the NUMERIC(10,2) initial_volume_ul / remaining_volume_ul columns
+with fixed-width INTEGER *_centi_ul columns (value x 100). The conversion is
+exact because the old columns held at most two decimal places. The ORM keeps
+exposing initial_volume_ul / remaining_volume_ul as Decimal uL.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "018"
+down_revision: Union[str, None] = "017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VOLUME_COLUMNS = ["initial_volume", "remaining_volume"]
+
+
+def upgrade() -> None:
+    for name in VOLUME_COLUMNS:
+        op.add_column("sample", sa.Column(f"{name}_centi_ul", sa.Integer, nullable=True))
+        op.execute(
+            f"UPDATE sample SET {name}_centi_ul = ROUND({name}_ul * 100)::INTEGER "
+            f"WHERE {name}_ul IS NOT NULL"
+        )
+        op.drop_column("sample", f"{name}_ul")
+
+
+def downgrade() -> None:
+    for name in VOLUME_COLUMNS:
+        op.add_column("sample", sa.Column(f"{name}_ul", sa.Numeric(10, 2), nullable=True))
+        op.execute(
+            f"UPDATE sample SET {name}_ul = {name}_centi_ul / 100.0 "
+            f"WHERE {name}_centi_ul IS NOT NULL"
+        )
+        op.drop_column("sample", f"{name}_centi_ul")
@@ -0,0 +1,38 @@
+"""Replace single-column partner_lab_result indexes with composites.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-17
+
+(import_id, match_status) subsumes the import_id index and
+(participant_id, canonical_test_id, test_date) subsumes the participant_id
+index, so each import row maintains the same number of B-trees while the
+common multi-column filters become single index scans.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "019"
+down_revision: Union[str, None] = "018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_plr_import_status", "partner_lab_result", ["import_id", "match_status"])
+    op.create_index(
+        "ix_plr_participant_test_date",
+        "partner_lab_result",
+        ["participant_id", "canonical_test_id", "test_date"],
+    )
+    op.drop_index("ix_partner_result_import", table_name="partner_lab_result")
+    op.drop_index("ix_partner_result_participant", table_name="partner_lab_result")
+
+
+def downgrade() -> None:
+    op.create_index("ix_partner_result_participant", "partner_lab_result", ["participant_id"])
+    op.create_index("ix_partner_result_import", "partner_lab_result", ["import_id"])
+    op.drop_index("ix_plr_participant_test_date", table_name="partner_lab_result")
+    op.drop_index("ix_plr_import_status", table_name="partner_lab_result")
@@ -0,0 +1,39 @@
+"""FILLFACTOR=70 on storage_position; partial index on occupied positions.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-17
+
+Sample moves rewrite position rows. Leaving 30% of each page free lets the
+new row version stay on the same page. ix_position_sample only needs
+occupied slots, since lookups are always by a concrete sample_id.
+
+The new fillfactor applies to pages written from now on; run
+VACUUM FULL storage_position in a maintenance window to repack existing pages.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "020"
+down_revision: Union[str, None] = "019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE storage_position SET (fillfactor = 70)")
+    op.drop_index("ix_position_sample", table_name="storage_position")
+    op.create_index(
+        "ix_position_sample",
+        "storage_position",
+        ["sample_id"],
+        postgresql_where="sample_id IS NOT NULL",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_position_sample", table_name="storage_position")
+    op.create_index("ix_position_sample", "storage_position", ["sample_id"])
+    op.execute("ALTER TABLE storage_position RESET (fillfactor)")
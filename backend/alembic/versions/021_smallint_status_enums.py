@@ -0,0 +1,124 @@
+"""Store sample/match/stool-kit status enums as SMALLINT codes.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-17
+
+The codes mirror SAMPLE_STATUS_CODES, MATCH_STATUS_CODES and
+STOOL_KIT_STATUS_CODES in app.models.enums and are hardcoded here so the
+migration stays valid if the enum module changes later. The two partial
+sample indexes have string predicates, so they are dropped and recreated
+around the type change. Each ALTER rewrites its table under an ACCESS
+EXCLUSIVE lock; run in a maintenance window.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "021"
+down_revision: Union[str, None] = "020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SAMPLE_STATUS = {
+    "registered": 1,
+    "collected": 2,
+    "transported": 3,
+    "received": 4,
+    "processing": 5,
+    "stored": 6,
+    "reserved": 7,
+    "in_analysis": 8,
+    "pending_discard": 9,
+    "depleted": 10,
+    "discarded": 11,
+}
+MATCH_STATUS = {"auto_matched": 1, "manual_matched": 2, "unmatched": 3}
+STOOL_KIT_STATUS = {
+    "issued": 1,
+    "pickup_scheduled": 2,
+    "collected_by_decodeage": 3,
+    "processing": 4,
+    "results_received": 5,
+}
+
+# (table, column, codes, original VARCHAR length)
+COLUMNS = [
+    ("sample", "status", SAMPLE_STATUS, 20),
+    ("sample_status_history", "previous_status", SAMPLE_STATUS, 20),
+    ("sample_status_history", "new_status", SAMPLE_STATUS, 20),
+    ("partner_lab_result", "match_status", MATCH_STATUS, 20),
+    ("stool_kit", "status", STOOL_KIT_STATUS, 30),
+]
+
+
+def _to_code(column: str, codes: dict[str, int]) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for name, code in codes.items())
+    return f"CASE {column} {whens} END"
+
+
+def _to_name(column: str, codes: dict[str, int]) -> str:
+    whens = " ".join(f"WHEN {code} THEN '{name}'" for name, code in codes.items())
+    return f"CASE {column} {whens} END"
+
+
+def _drop_partial_sample_indexes() -> None:
+    op.drop_index("ix_sample_pending_discard", table_name="sample")
+    op.drop_index("ix_sample_status_active", table_name="sample")
+
+
+def upgrade() -> None:
+    _drop_partial_sample_indexes()
+    op.execute("ALTER TABLE stool_kit ALTER COLUMN status DROP DEFAULT")
+
+    for table, column, codes, _ in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE SMALLINT "
+            f"USING {_to_code(column, codes)}"
+        )
+        op.create_check_constraint(
+            f"ck_{table}_{column}_code",
+            table,
+            f"{column} BETWEEN 1 AND {max(codes.values())}",
+        )
+
+    op.execute("ALTER TABLE stool_kit ALTER COLUMN status SET DEFAULT 1")
+    op.create_index(
+        "ix_sample_status_active",
+        "sample",
+        ["status"],
+        postgresql_where="status NOT IN (10, 11)",
+    )
+    op.create_index(
+        "ix_sample_pending_discard",
+        "sample",
+        ["participant_id"],
+        postgresql_where="status = 9",
+    )
+
+
+def downgrade() -> None:
+    _drop_partial_sample_indexes()
+    op.execute("ALTER TABLE stool_kit ALTER COLUMN status DROP DEFAULT")
+
+    for table, column, codes, length in COLUMNS:
+        op.drop_constraint(f"ck_{table}_{column}_code", table, type_="check")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR({length}) "
+            f"USING {_to_name(column, codes)}"
+        )
+
+    op.execute("ALTER TABLE stool_kit ALTER COLUMN status SET DEFAULT 'issued'")
+    op.create_index(
+        "ix_sample_status_active",
+        "sample",
+        ["status"],
+        postgresql_where="status NOT IN ('discarded', 'depleted')",
+    )
+    op.create_index(
+        "ix_sample_pending_discard",
+        "sample",
+        ["participant_id"],
+        postgresql_where="status = 'pending_discard'",
+    )
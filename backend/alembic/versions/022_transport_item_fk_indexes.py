@@ -0,0 +1,39 @@
+"""Index sample_transport_item foreign keys to sample and storage_box.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-17
+
+Without child-side indexes, every delete or key update on sample or
+storage_box seqscans sample_transport_item for the FK check. The indexes are
+partial because an item references either a sample or a box, never both.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "022"
+down_revision: Union[str, None] = "021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transport_item_sample",
+        "sample_transport_item",
+        ["sample_id"],
+        postgresql_where="sample_id IS NOT NULL",
+    )
+    op.create_index(
+        "ix_transport_item_box",
+        "sample_transport_item",
+        ["box_id"],
+        postgresql_where="box_id IS NOT NULL",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transport_item_box", table_name="sample_transport_item")
+    op.drop_index("ix_transport_item_sample", table_name="sample_transport_item")
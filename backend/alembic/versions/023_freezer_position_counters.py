@@ -0,0 +1,96 @@
+"""Maintain per-freezer position counters on freezer.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-17
+
+freezer.total_positions and freezer.occupied_positions are backfilled here
+and kept current by a row trigger on storage_position (insert, delete, and
+updates of sample_id or freezer_id). Utilization reads become a single-row
+lookup instead of a freezer -> rack -> box -> position count. The trigger
+updates the freezer row, so concurrent stores into the same freezer
+serialize on that row for the rest of their transaction.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "023"
+down_revision: Union[str, None] = "022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "freezer",
+        sa.Column("total_positions", sa.Integer, server_default="0", nullable=False),
+    )
+    op.add_column(
+        "freezer",
+        sa.Column("occupied_positions", sa.Integer, server_default="0", nullable=False),
+    )
+
+    op.execute(
+        """
+        UPDATE freezer f
+        SET total_positions = c.total, occupied_positions = c.occupied
+        FROM (
+            SELECT freezer_id, count(*) AS total, count(sample_id) AS occupied
+            FROM storage_position
+            GROUP BY freezer_id
+        ) c
+        WHERE f.id = c.freezer_id
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION storage_position_sync_freezer_counts() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE'
+               AND OLD.freezer_id = NEW.freezer_id
+               AND (OLD.sample_id IS NULL) = (NEW.sample_id IS NULL) THEN
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE freezer
+                SET total_positions = total_positions - 1,
+                    occupied_positions = occupied_positions
+                        - (OLD.sample_id IS NOT NULL)::int
+                WHERE id = OLD.freezer_id;
+            END IF;
+
+            IF TG_OP IN ('UPDATE', 'INSERT') THEN
+                UPDATE freezer
+                SET total_positions = total_positions + 1,
+                    occupied_positions = occupied_positions
+                        + (NEW.sample_id IS NOT NULL)::int
+                WHERE id = NEW.freezer_id;
+            END IF;
+
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_storage_position_freezer_counts
+        AFTER INSERT OR DELETE OR UPDATE OF sample_id, freezer_id ON storage_position
+        FOR EACH ROW EXECUTE FUNCTION storage_position_sync_freezer_counts()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_storage_position_freezer_counts ON storage_position"
+    )
+    op.execute("DROP FUNCTION IF EXISTS storage_position_sync_freezer_counts()")
+    op.drop_column("freezer", "occupied_positions")
+    op.drop_column("freezer", "total_positions")
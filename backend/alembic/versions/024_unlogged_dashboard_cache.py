@@ -0,0 +1,29 @@
+"""Make dashboard_cache UNLOGGED.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-17
+
+Every row is regenerable from the source tables, so cache refreshes need not
+write WAL. An unlogged table is truncated after a crash and is not copied to
+streaming replicas; the dashboards then recompute on the next refresh.
+SET UNLOGGED rewrites the table under an ACCESS EXCLUSIVE lock, which is
+cheap here since it holds only a handful of rows.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "024"
+down_revision: Union[str, None] = "023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE dashboard_cache SET UNLOGGED")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE dashboard_cache SET LOGGED")
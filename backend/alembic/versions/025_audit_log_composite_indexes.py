@@ -0,0 +1,47 @@
+"""Composite (filter, timestamp DESC) indexes on audit_log.
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-17
+
+Entity history and per-user activity are filtered and then sorted newest
+first. The composites serve both in one index scan and replace the
+single-purpose entity and user_id indexes, which are their prefixes.
+ix_audit_log_timestamp stays for the unfiltered audit list and the 30-day
+report window.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "025"
+down_revision: Union[str, None] = "024"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audit_log_entity_timestamp",
+        "audit_log",
+        ["entity_type", "entity_id", "timestamp"],
+        postgresql_using="btree",
+        postgresql_ops={"timestamp": "DESC"},
+    )
+    op.create_index(
+        "ix_audit_log_user_timestamp",
+        "audit_log",
+        ["user_id", "timestamp"],
+        postgresql_using="btree",
+        postgresql_ops={"timestamp": "DESC"},
+    )
+    op.drop_index("ix_audit_log_entity", table_name="audit_log")
+    op.drop_index("ix_audit_log_user_id", table_name="audit_log")
+
+
+def downgrade() -> None:
+    op.create_index("ix_audit_log_user_id", "audit_log", ["user_id"])
+    op.create_index("ix_audit_log_entity", "audit_log", ["entity_type", "entity_id"])
+    op.drop_index("ix_audit_log_user_timestamp", table_name="audit_log")
+    op.drop_index("ix_audit_log_entity_timestamp", table_name="audit_log")
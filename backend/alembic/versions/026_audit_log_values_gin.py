@@ -0,0 +1,40 @@
+"""GIN jsonb_path_ops indexes on audit_log old_values / new_values.
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-17
+
+Backs the @> containment filters on the audit log list endpoint.
+additional_context is not indexed: nothing filters on it.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "026"
+down_revision: Union[str, None] = "025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audit_log_old_values_gin",
+        "audit_log",
+        ["old_values"],
+        postgresql_using="gin",
+        postgresql_ops={"old_values": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_audit_log_new_values_gin",
+        "audit_log",
+        ["new_values"],
+        postgresql_using="gin",
+        postgresql_ops={"new_values": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_log_new_values_gin", table_name="audit_log")
+    op.drop_index("ix_audit_log_old_values_gin", table_name="audit_log")
@@ -0,0 +1,34 @@
+"""Partial index on live user sessions for token lookups.
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-17
+
+Session validation always filters revoked_at IS NULL and expires_at > now().
+Revoked rows are left out of the index; expires_at is the second key so the
+expiry check is answered from the index.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "027"
+down_revision: Union[str, None] = "026"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_user_session_token_hash_live",
+        "user_session",
+        ["token_hash", "expires_at"],
+        postgresql_where="revoked_at IS NULL",
+    )
+    op.drop_index("ix_user_session_token_hash", table_name="user_session")
+
+
+def downgrade() -> None:
+    op.create_index("ix_user_session_token_hash", "user_session", ["token_hash"])
+    op.drop_index("ix_user_session_token_hash_live", table_name="user_session")
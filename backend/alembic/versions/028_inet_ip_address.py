@@ -0,0 +1,59 @@
+"""Store audit_log / user_session ip_address as INET.
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-17
+
+INET packs an address into 7 (IPv4) or 19 (IPv6) bytes instead of up to 45
+characters of text. Existing values that are not valid addresses (e.g.
+"testclient") become NULL instead of failing the conversion.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "028"
+down_revision: Union[str, None] = "027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("audit_log", "user_session")
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.try_inet(value text) RETURNS inet
+        LANGUAGE plpgsql IMMUTABLE AS $$
+        BEGIN
+            RETURN value::inet;
+        EXCEPTION WHEN others THEN
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "ip_address",
+            type_=postgresql.INET(),
+            existing_type=sa.String(45),
+            existing_nullable=True,
+            postgresql_using="pg_temp.try_inet(ip_address)",
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "ip_address",
+            type_=sa.String(45),
+            existing_type=postgresql.INET(),
+            existing_nullable=True,
+            postgresql_using="host(ip_address)",
+        )
@@ -0,0 +1,48 @@
+"""Store managed_file.checksum_sha256 as a 32-byte BYTEA digest.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-17
+
+The raw digest is half the size of its hex text in both the heap and
+ix_managed_file_checksum. The application still reads and writes hex strings
+(HexDigest type decorator).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "029"
+down_revision: Union[str, None] = "028"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "managed_file",
+        "checksum_sha256",
+        type_=sa.LargeBinary(),
+        existing_type=sa.String(64),
+        existing_nullable=False,
+        postgresql_using="decode(checksum_sha256, 'hex')",
+    )
+    op.create_check_constraint(
+        "ck_managed_file_checksum_sha256_len",
+        "managed_file",
+        "octet_length(checksum_sha256) = 32",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_managed_file_checksum_sha256_len", "managed_file", type_="check")
+    op.alter_column(
+        "managed_file",
+        "checksum_sha256",
+        type_=sa.String(64),
+        existing_type=sa.LargeBinary(),
+        existing_nullable=False,
+        postgresql_using="encode(checksum_sha256, 'hex')",
+    )
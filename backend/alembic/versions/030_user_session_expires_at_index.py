@@ -0,0 +1,26 @@
+"""Index user_session.expires_at for the expired-session purge.
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-17
+
+The purge task deletes sessions with expires_at before a cutoff in batches.
+Revoked sessions must be found too, so the index is not partial.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "030"
+down_revision: Union[str, None] = "029"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_session_expires_at", "user_session", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_session_expires_at", table_name="user_session")
@@ -0,0 +1,33 @@
+"""Partial index on partner_lab_result (participant_id, test_date).
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-17
+
+The enrollment backfill takes MIN(test_date) per participant over dated
+results only. The existing (participant_id, canonical_test_id, test_date)
+index has canonical_test_id in the middle, so every result row per
+participant had to be read. Undated rows never qualify and are left out.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "031"
+down_revision: Union[str, None] = "030"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_plr_participant_dated",
+        "partner_lab_result",
+        ["participant_id", "test_date"],
+        postgresql_where="test_date IS NOT NULL",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_plr_participant_dated", table_name="partner_lab_result")
@@ -5,7 +5,8 @@ import uuid
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import and_, cast, func, or_, select, String
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -30,6 +31,8 @@ async def list_audit_logs(
     date_from: datetime | None = None,
     date_to: datetime | None = None,
     search: str | None = None,
+    old_values: str | None = Query(None, description="JSON object the old values must contain"),
+    new_values: str | None = Query(None, description="JSON object the new values must contain"),
 ):
     """
     List audit logs with pagination and filters.
@@ -61,6 +64,21 @@ async def list_audit_logs(
     if date_to is not None:
         filters.append(AuditLog.timestamp <= date_to)
 
+    # JSONB containment (@>) so the jsonb_path_ops GIN indexes apply
+    for column, raw in ((AuditLog.old_values, old_values), (AuditLog.new_values, new_values)):
+        if raw is None:
+            continue
+        try:
+            expected = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            expected = None
+        if not isinstance(expected, dict):
+            raise HTTPException(
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                f"{column.key} must be a JSON object.",
+            )
+        filters.append(column.contains(expected))
+
     if search:
         # Search in entity_type, entity_id (as string), or ip_address
         search_pattern = f"%{search}%"
@@ -68,7 +86,7 @@ async def list_audit_logs(
             or_(
                 AuditLog.entity_type.ilike(search_pattern),
                 cast(AuditLog.entity_id, String).ilike(search_pattern),
-                AuditLog.ip_address.ilike(search_pattern),
+                cast(AuditLog.ip_address, String).ilike(search_pattern),
             )
         )
 
@@ -1,5 +1,6 @@
 """Authentication endpoints: login, logout, refresh, change-password, password reset."""
 
+import ipaddress
 import logging
 from typing import Annotated
 
@@ -33,8 +34,12 @@ _login_rate_limit = RateLimiter(max_calls=10, window_seconds=60, key="login", by
 
 
 def _client_ip(request: Request) -> str | None:
+    # ip_address columns are INET; drop non-IP peers (unix sockets, test clients)
     if request.client:
-        return request.client.host
+        try:
+            return str(ipaddress.ip_address(request.client.host))
+        except ValueError:
+            return None
     return None
 
 
@@ -8,10 +8,12 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import require_role
+from app.core.deps import json_body, require_role
+from app.core.responses import ModelJSONResponse
 from app.database import get_db
 from app.models.enums import FieldEventStatus, UserRole
 from app.models.user import User
+from app.schemas import APIResponse
 from app.schemas.field_ops import (
     BulkDigitizeRequest,
     CheckInRequest,
@@ -87,7 +89,7 @@ async def create_field_event(
     }
 
 
-@router.get("/{event_id}", response_model=dict)
+@router.get("/{event_id}", response_model=APIResponse[FieldEventDetail])
 async def get_field_event(
     event_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -106,10 +108,7 @@ async def get_field_event(
         EventParticipantRead(**row) for row in roster
     ]
 
-    return {
-        "success": True,
-        "data": detail.model_dump(mode="json"),
-    }
+    return ModelJSONResponse(APIResponse[FieldEventDetail](data=detail))
 
 
 @router.put("/{event_id}", response_model=dict)
@@ -136,7 +135,7 @@ async def update_field_event(
 @router.post("/{event_id}/participants", response_model=dict, status_code=status.HTTP_201_CREATED)
 async def add_participants(
     event_id: uuid.UUID,
-    data: EventParticipantBulkAdd,
+    data: Annotated[EventParticipantBulkAdd, Depends(json_body(EventParticipantBulkAdd))],
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_role(*WRITE_ROLES))],
 ):
@@ -177,7 +176,7 @@ async def check_in_participant(
 @router.post("/{event_id}/bulk-update", response_model=dict)
 async def bulk_digitize(
     event_id: uuid.UUID,
-    data: BulkDigitizeRequest,
+    data: Annotated[BulkDigitizeRequest, Depends(json_body(BulkDigitizeRequest))],
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_role(*WRITE_ROLES))],
 ):
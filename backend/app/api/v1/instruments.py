@@ -9,7 +9,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import require_role
+from app.core.deps import json_body, require_role
+from app.core.responses import ModelJSONResponse
 from app.database import get_db
 from app.models.enums import (
     InstrumentType,
@@ -19,6 +20,7 @@ from app.models.enums import (
     UserRole,
 )
 from app.models.user import User
+from app.schemas import APIResponse
 from app.schemas.instrument import (
     InstrumentCreate,
     InstrumentRead,
@@ -152,7 +154,7 @@ async def create_plate(
     }
 
 
-@router.get("/plates/{plate_id}", response_model=dict)
+@router.get("/plates/{plate_id}", response_model=APIResponse[PlateDetail])
 async def get_plate_detail(
     plate_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -163,16 +165,13 @@ async def get_plate_detail(
     detail = await svc.get_plate_detail(plate_id)
     if detail is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Plate not found.")
-    return {
-        "success": True,
-        "data": PlateDetail(**detail).model_dump(mode="json"),
-    }
+    return ModelJSONResponse(APIResponse[PlateDetail](data=PlateDetail(**detail)))
 
 
 @router.post("/plates/{plate_id}/assign-wells", response_model=dict)
 async def assign_wells(
     plate_id: uuid.UUID,
-    data: WellAssignRequest,
+    data: Annotated[WellAssignRequest, Depends(json_body(WellAssignRequest))],
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_role(*WRITE_ROLES))],
 ):
@@ -404,7 +403,7 @@ async def upload_run_results(
 
 # ── Omics Results (static paths before /{instrument_id}) ─────────────
 
-@router.get("/omics-results", response_model=dict)
+@router.get("/omics-results", response_model=APIResponse[list[OmicsResultRead]])
 async def query_omics_results(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_role(*ALL_ROLES))],
@@ -422,14 +421,13 @@ async def query_omics_results(
         result_set_id=result_set_id, sample_id=sample_id,
         participant_id=participant_id, feature_id=feature_id,
     )
-    return {
-        "success": True,
-        "data": [OmicsResultRead(**item).model_dump(mode="json") for item in items],
-        "meta": _paginate_meta(page, per_page, total),
-    }
+    return ModelJSONResponse(APIResponse[list[OmicsResultRead]](
+        data=[OmicsResultRead(**item) for item in items],
+        meta=_paginate_meta(page, per_page, total),
+    ))
 
 
-@router.get("/omics-result-sets", response_model=dict)
+@router.get("/omics-result-sets", response_model=APIResponse[list[OmicsResultSetRead]])
 async def list_omics_result_sets(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_role(*ALL_ROLES))],
@@ -444,11 +442,10 @@ async def list_omics_result_sets(
         page=page, per_page=per_page,
         run_id=run_id, result_type=result_type,
     )
-    return {
-        "success": True,
-        "data": [OmicsResultSetRead.model_validate(rs).model_dump(mode="json") for rs in items],
-        "meta": _paginate_meta(page, per_page, total),
-    }
+    return ModelJSONResponse(APIResponse[list[OmicsResultSetRead]](
+        data=[OmicsResultSetRead.model_validate(rs) for rs in items],
+        meta=_paginate_meta(page, per_page, total),
+    ))
 
 
 @router.get("/omics-result-sets/{result_set_id}", response_model=dict)
@@ -5,12 +5,15 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import require_role
+from app.core.responses import ModelJSONResponse
 from app.database import get_db
 from app.models.enums import PartnerName, StoolKitStatus, UserRole
 from app.models.user import User
+from app.schemas import APIResponse
 from app.schemas.partner import (
     CanonicalTestCreate,
     CanonicalTestRead,
@@ -21,13 +24,17 @@ from app.schemas.partner import (
     OdkFormConfigCreate,
     OdkFormConfigRead,
     OdkFormConfigUpdate,
+    OdkSubmissionDetail,
     OdkSubmissionRead,
     OdkSyncLogRead,
     OdkSyncTriggerRequest,
+    PartnerLabImportDetail,
     PartnerLabImportRead,
     PartnerLabResultRead,
+    PartnerLabResultReadListAdapter,
     StoolKitCreate,
     StoolKitRead,
+    StoolKitReadListAdapter,
     StoolKitUpdate,
     TestNameAliasCreate,
     TestNameAliasRead,
@@ -171,6 +178,22 @@ async def list_submissions(
     }
 
 
+@router.get("/odk/submissions/{submission_id}", response_model=APIResponse[OdkSubmissionDetail])
+async def get_submission(
+    submission_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(require_role(*ALL_ROLES))],
+):
+    """Get a single ODK submission including its payload."""
+    svc = OdkService(db)
+    submission = await svc.get_submission(submission_id)
+    if submission is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Submission not found.")
+    return ModelJSONResponse(
+        APIResponse[OdkSubmissionDetail](data=OdkSubmissionDetail.model_validate(submission))
+    )
+
+
 # ---------------------------------------------------------------------------
 # Partner Lab Imports
 # ---------------------------------------------------------------------------
@@ -293,7 +316,7 @@ async def list_imports(
     }
 
 
-@router.get("/imports/{import_id}", response_model=dict)
+@router.get("/imports/{import_id}", response_model=APIResponse[PartnerLabImportDetail])
 async def get_import_detail(
     import_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -305,15 +328,12 @@ async def get_import_detail(
     if record is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Import not found.")
 
-    data = PartnerLabImportRead.model_validate(record).model_dump(mode="json")
-    data["results"] = [
-        PartnerLabResultRead.model_validate(r).model_dump(mode="json")
-        for r in record.results
-    ]
-    return {"success": True, "data": data}
+    return ModelJSONResponse(
+        APIResponse[PartnerLabImportDetail](data=PartnerLabImportDetail.model_validate(record))
+    )
 
 
-@router.get("/partner-results", response_model=dict)
+@router.get("/partner-results", response_model=APIResponse[list[PartnerLabResultRead]])
 async def list_partner_results(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_role(*ALL_ROLES))],
@@ -326,16 +346,15 @@ async def list_partner_results(
     results, total = await svc.list_partner_results(
         participant_id=participant_id, page=page, per_page=per_page,
     )
-    return {
-        "success": True,
-        "data": [PartnerLabResultRead.model_validate(r).model_dump(mode="json") for r in results],
-        "meta": {
+    return ModelJSONResponse(APIResponse[list[PartnerLabResultRead]](
+        data=PartnerLabResultReadListAdapter.validate_python(results),
+        meta={
             "page": page,
             "per_page": per_page,
             "total": total,
             "total_pages": math.ceil(total / per_page) if per_page else 0,
         },
-    }
+    ))
 
 
 # ---------------------------------------------------------------------------
@@ -431,7 +450,21 @@ async def add_alias(
 ):
     """Add a partner test name alias to a canonical test."""
     svc = CanonicalTestService(db)
-    alias = await svc.add_alias(test_id, data, created_by=current_user.id)
+    try:
+        alias = await svc.add_alias(test_id, data, created_by=current_user.id)
+    except IntegrityError as exc:
+        await db.rollback()
+        # asyncpg's error (the DBAPI error's cause) names the constraint
+        constraint = getattr(exc.orig.__cause__, "constraint_name", None)
+        if constraint == "uq_alias_partner_name":
+            raise HTTPException(
+                status.HTTP_409_CONFLICT,
+                f"Alias '{data.alias_name}' already exists for {data.partner_name.value}.",
+            )
+        if getattr(exc.orig, "sqlstate", None) == "23503":
+            # foreign_key_violation: canonical_test_id is the only FK
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Canonical test not found.")
+        raise
     return {
         "success": True,
         "data": TestNameAliasRead.model_validate(alias).model_dump(mode="json"),
@@ -490,7 +523,7 @@ async def update_kit(
     }
 
 
-@router.get("/stool-kits", response_model=dict)
+@router.get("/stool-kits", response_model=APIResponse[list[StoolKitRead]])
 async def list_kits(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_role(*ALL_ROLES))],
@@ -505,13 +538,12 @@ async def list_kits(
         participant_id=participant_id, status=kit_status,
         page=page, per_page=per_page,
     )
-    return {
-        "success": True,
-        "data": [StoolKitRead.model_validate(k).model_dump(mode="json") for k in kits],
-        "meta": {
+    return ModelJSONResponse(APIResponse[list[StoolKitRead]](
+        data=StoolKitReadListAdapter.validate_python(kits),
+        meta={
             "page": page,
             "per_page": per_page,
             "total": total,
             "total_pages": math.ceil(total / per_page) if per_page else 0,
         },
-    }
+    ))
@@ -7,14 +7,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import Response, StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.deps import require_role
 from app.database import get_db
 from app.models.enums import UserRole
-from app.models.participant import CollectionSite
+from app.models.participant import CollectionSite, Participant
 from app.models.sample import Sample
-from app.models.storage import StorageBox, StoragePosition, StorageRack
+from app.models.storage import Freezer, StorageBox, StoragePosition, StorageRack
 from app.models.user import User
 from app.schemas.qr import QrBatchRequest, QrLookupResponse, QrStorageInfo
 from app.services.qr_code import generate_batch_qr, generate_sample_qr
@@ -89,62 +88,59 @@ async def lookup_by_code(
     current_user: Annotated[User, Depends(require_role(*ALL_ROLES))],
 ):
     """Look up sample info by sample_code (QR scan endpoint)."""
+    # One round trip: participant, site and storage location are outer-joined
+    # and fetched as flat columns. Positions carry rack_id/freezer_id, so the
+    # rack and freezer join straight off the position.
     result = await db.execute(
-        select(Sample)
-        .options(selectinload(Sample.participant))
+        select(
+            Sample.id,
+            Sample.sample_code,
+            Sample.status,
+            Sample.sample_type,
+            Sample.wave,
+            Participant.participant_code,
+            CollectionSite.name.label("collection_site_name"),
+            StorageBox.box_name,
+            StorageRack.rack_name,
+            Freezer.name.label("freezer_name"),
+            StoragePosition.row,
+            StoragePosition.column,
+        )
+        .outerjoin(Participant, Participant.id == Sample.participant_id)
+        .outerjoin(CollectionSite, CollectionSite.id == Participant.collection_site_id)
+        .outerjoin(StoragePosition, StoragePosition.id == Sample.storage_location_id)
+        .outerjoin(StorageBox, StorageBox.id == StoragePosition.box_id)
+        .outerjoin(StorageRack, StorageRack.id == StoragePosition.rack_id)
+        .outerjoin(Freezer, Freezer.id == StoragePosition.freezer_id)
         .where(
             Sample.sample_code == code,
             Sample.is_deleted == False,  # noqa: E712
         )
     )
-    sample = result.scalar_one_or_none()
-    if sample is None:
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Sample not found.")
 
-    # Resolve participant code and collection site name
-    participant_code: str | None = None
-    collection_site_name: str | None = None
-    if sample.participant:
-        participant_code = sample.participant.participant_code
-        if sample.participant.collection_site_id:
-            site_result = await db.execute(
-                select(CollectionSite.name).where(
-                    CollectionSite.id == sample.participant.collection_site_id
-                )
-            )
-            collection_site_name = site_result.scalar_one_or_none()
-
-    # Resolve storage location
+    # box_name is NOT NULL, so it is only missing when the sample has no
+    # position (or the position's box is gone)
     storage_info: QrStorageInfo | None = None
-    if sample.storage_location_id:
-        pos_result = await db.execute(
-            select(StoragePosition)
-            .options(
-                selectinload(StoragePosition.box)
-                .selectinload(StorageBox.rack)
-                .selectinload(StorageRack.freezer)
-            )
-            .where(StoragePosition.id == sample.storage_location_id)
+    if row.box_name is not None:
+        storage_info = QrStorageInfo(
+            freezer_name=row.freezer_name,
+            rack_name=row.rack_name,
+            box_name=row.box_name,
+            row=row.row,
+            column=row.column,
         )
-        position = pos_result.scalar_one_or_none()
-        if position and position.box:
-            box = position.box
-            storage_info = QrStorageInfo(
-                freezer_name=box.rack.freezer.name if box.rack and box.rack.freezer else None,
-                rack_name=box.rack.rack_name if box.rack else None,
-                box_name=box.box_name,
-                row=position.row,
-                column=position.column,
-            )
 
     resp = QrLookupResponse(
-        sample_id=sample.id,
-        sample_code=sample.sample_code,
-        status=sample.status,
-        sample_type=sample.sample_type.value,
-        participant_code=participant_code,
-        collection_site=collection_site_name,
-        wave=sample.wave,
+        sample_id=row.id,
+        sample_code=row.sample_code,
+        status=row.status,
+        sample_type=row.sample_type.value,
+        participant_code=row.participant_code,
+        collection_site=row.collection_site_name,
+        wave=row.wave,
         storage=storage_info,
     )
     return {
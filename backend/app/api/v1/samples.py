@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import require_role
+from app.core.responses import ModelJSONResponse
 from app.database import get_db
 from app.models.enums import (
     DiscardRequestStatus,
@@ -17,6 +18,7 @@ from app.models.enums import (
     UserRole,
 )
 from app.models.user import User
+from app.schemas import APIResponse
 from app.schemas.sample import (
     DiscardApprovalRequest,
     DiscardRequestCreate,
@@ -24,6 +26,7 @@ from app.schemas.sample import (
     SampleCreate,
     SampleDetail,
     SampleRead,
+    SampleReadListAdapter,
     SampleStatusUpdate,
     SampleUpdate,
     StatusHistoryRead,
@@ -48,7 +51,7 @@ WRITE_ROLES = (
 )
 
 
-@router.get("", response_model=dict)
+@router.get("", response_model=APIResponse[list[SampleRead]])
 async def list_samples(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_role(*ALL_ROLES))],
@@ -71,16 +74,15 @@ async def list_samples(
         participant_id=participant_id, sample_type=sample_type,
         status=effective_status, wave=wave, sort=sort, order=order,
     )
-    return {
-        "success": True,
-        "data": [SampleRead.model_validate(s).model_dump(mode="json") for s in samples],
-        "meta": {
+    return ModelJSONResponse(APIResponse[list[SampleRead]](
+        data=SampleReadListAdapter.validate_python(samples),
+        meta={
             "page": page,
             "per_page": per_page,
             "total": total,
             "total_pages": math.ceil(total / per_page) if per_page else 0,
         },
-    }
+    ))
 
 
 @router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
@@ -151,7 +153,7 @@ async def approve_discard(
     }
 
 
-@router.get("/{sample_id}", response_model=dict)
+@router.get("/{sample_id}", response_model=APIResponse[SampleDetail])
 async def get_sample(
     sample_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -163,24 +165,16 @@ async def get_sample(
     if sample is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Sample not found.")
 
+    # History arrives newest-first and aliquots are already filtered to live
+    # rows by the loader, so one validation pass builds the whole detail.
     detail = SampleDetail.model_validate(sample)
-    detail.status_history = [
-        StatusHistoryRead.model_validate(h)
-        for h in sorted(sample.status_history, key=lambda h: h.changed_at, reverse=True)
-    ]
-    detail.aliquots = [
-        SampleRead.model_validate(a) for a in sample.aliquots if not a.is_deleted
-    ]
 
     # Processing timer elapsed
     if sample.processing_started_at and sample.status == SampleStatus.PROCESSING:
         elapsed = (datetime.now(timezone.utc) - sample.processing_started_at).total_seconds()
         detail.processing_elapsed_seconds = int(elapsed)
 
-    return {
-        "success": True,
-        "data": detail.model_dump(mode="json"),
-    }
+    return ModelJSONResponse(APIResponse[SampleDetail](data=detail))
 
 
 @router.put("/{sample_id}", response_model=dict)
@@ -222,7 +216,7 @@ async def update_status(
     }
 
 
-@router.post("/{sample_id}/aliquot", response_model=dict)
+@router.post("/{sample_id}/aliquot", response_model=APIResponse[list[SampleRead]])
 async def generate_aliquots(
     sample_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -231,11 +225,10 @@ async def generate_aliquots(
     """Auto-generate aliquots from rules for this parent sample."""
     svc = SampleService(db)
     aliquots = await svc.auto_generate_aliquots(sample_id, created_by=current_user.id)
-    return {
-        "success": True,
-        "data": [SampleRead.model_validate(a).model_dump(mode="json") for a in aliquots],
-        "meta": {"count": len(aliquots)},
-    }
+    return ModelJSONResponse(APIResponse[list[SampleRead]](
+        data=SampleReadListAdapter.validate_python(aliquots),
+        meta={"count": len(aliquots)},
+    ))
 
 
 @router.post("/{sample_id}/withdraw", response_model=dict)
@@ -272,10 +265,12 @@ async def get_history(
     sample = await svc.get_sample(sample_id)
     if sample is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Sample not found.")
-    history = sorted(sample.status_history, key=lambda h: h.changed_at, reverse=True)
     return {
         "success": True,
-        "data": [StatusHistoryRead.model_validate(h).model_dump(mode="json") for h in history],
+        "data": [
+            StatusHistoryRead.model_validate(h).model_dump(mode="json")
+            for h in sample.status_history
+        ],
     }
 
 
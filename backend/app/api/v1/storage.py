@@ -9,14 +9,17 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import require_role
+from app.core.responses import ModelJSONResponse
 from app.database import get_db
 from app.models.enums import FreezerType, UserRole
 from app.models.user import User
+from app.schemas import APIResponse
 from app.schemas.storage import (
     AutoAssignRequest,
     BoxCreate,
     BoxDetail,
     BoxRead,
+    BoxReadListAdapter,
     BoxUpdate,
     BulkAssignRequest,
     ConsolidateRequest,
@@ -25,6 +28,7 @@ from app.schemas.storage import (
     FreezerUpdate,
     PositionAssign,
     PositionRead,
+    PositionReadListAdapter,
     RackBatchCreate,
     RackCreate,
     RackRead,
@@ -202,7 +206,7 @@ async def batch_create_racks(
 
 # ── Boxes ─────────────────────────────────────────────────────────────
 
-@router.get("/boxes", response_model=dict)
+@router.get("/boxes", response_model=APIResponse[list[BoxRead]])
 async def list_boxes(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_role(*ALL_ROLES))],
@@ -220,16 +224,15 @@ async def list_boxes(
         rack_id=rack_id, freezer_id=freezer_id,
         group_code=group_code, has_space=has_space,
     )
-    return {
-        "success": True,
-        "data": [BoxRead(**item).model_dump(mode="json") for item in items],
-        "meta": {
+    return ModelJSONResponse(APIResponse[list[BoxRead]](
+        data=BoxReadListAdapter.validate_python(items),
+        meta={
             "page": page,
             "per_page": per_page,
             "total": total,
             "total_pages": math.ceil(total / per_page) if per_page else 0,
         },
-    }
+    ))
 
 
 @router.post("/boxes", response_model=dict, status_code=status.HTTP_201_CREATED)
@@ -248,7 +251,7 @@ async def create_box(
     }
 
 
-@router.get("/boxes/{box_id}", response_model=dict)
+@router.get("/boxes/{box_id}", response_model=APIResponse[BoxDetail])
 async def get_box_detail(
     box_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -259,10 +262,7 @@ async def get_box_detail(
     detail = await svc.get_box_detail(box_id)
     if detail is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Storage box not found.")
-    return {
-        "success": True,
-        "data": BoxDetail(**detail).model_dump(mode="json"),
-    }
+    return ModelJSONResponse(APIResponse[BoxDetail](data=BoxDetail(**detail)))
 
 
 @router.put("/boxes/{box_id}", response_model=dict)
@@ -348,7 +348,7 @@ async def auto_assign(
     }
 
 
-@router.post("/bulk-assign", response_model=dict)
+@router.post("/bulk-assign", response_model=APIResponse[list[PositionRead]])
 async def bulk_assign(
     data: BulkAssignRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -362,11 +362,10 @@ async def bulk_assign(
         )
     except ValueError as e:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e))
-    return {
-        "success": True,
-        "data": [PositionRead.model_validate(p).model_dump(mode="json") for p in positions],
-        "meta": {"count": len(positions)},
-    }
+    return ModelJSONResponse(APIResponse[list[PositionRead]](
+        data=PositionReadListAdapter.validate_python(positions),
+        meta={"count": len(positions)},
+    ))
 
 
 @router.post("/boxes/{box_id}/consolidate", response_model=dict)
@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import require_role
+from app.core.deps import json_body, require_role
 from app.database import get_db
 from app.models.enums import UserRole
 from app.models.user import User
@@ -25,7 +25,7 @@ SYNC_ROLES = (
 
 @router.post("/push", response_model=dict)
 async def sync_push(
-    data: SyncPushRequest,
+    data: Annotated[SyncPushRequest, Depends(json_body(SyncPushRequest))],
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(require_role(*SYNC_ROLES))],
 ):
@@ -32,6 +32,10 @@ celery.conf.update(
             "task": "app.tasks.reports.process_scheduled_reports",
             "schedule": 900,  # every 15 minutes
         },
+        "purge-expired-sessions": {
+            "task": "app.tasks.auth.purge_expired_sessions",
+            "schedule": crontab(hour=3, minute=30),  # Daily 3:30 AM IST
+        },
     },
 )
 
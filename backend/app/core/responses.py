@@ -0,0 +1,32 @@
+"""Response classes that serialize pydantic models directly.
+
+Routes normally return a plain dict envelope built from
+``model_dump(mode="json")``. FastAPI then validates that dict against
+``response_model=dict``, runs it through ``jsonable_encoder`` and finally
+``json.dumps``, walking every nested value three more times. For large
+payloads (plate wells, event rosters, omics result pages), build an
+``APIResponse`` and return it wrapped in ``ModelJSONResponse``. pydantic-core
+then writes the JSON bytes in a single pass:
+
+    return ModelJSONResponse(APIResponse[PlateDetail](data=detail))
+"""
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class ModelJSONResponse(Response):
+    """JSON response rendered by the model's own pydantic-core serializer.
+
+    Unset ``meta``/``error`` envelope keys are left out, so the body is
+    identical to the equivalent dict envelope.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        exclude = {
+            name for name in ("meta", "error")
+            if getattr(content, name, None) is None
+        }
+        return content.__pydantic_serializer__.to_json(content, exclude=exclude)
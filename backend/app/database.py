@@ -1,14 +1,25 @@
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
 
+
+def _json_serializer(obj) -> str:
+    """Encode JSONB bind values with orjson instead of stdlib json.dumps."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     pool_size=20,
     max_overflow=10,
     pool_pre_ping=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    # INET columns round-trip as plain strings rather than ipaddress objects
+    native_inet_types=False,
 )
 
 async_session_factory = async_sessionmaker(
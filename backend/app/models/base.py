@@ -1,14 +1,18 @@
 """Base model mixin with UUID primary key, timestamps, and soft delete."""
 
+import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, func
+import msgpack
+from sqlalchemy import Boolean, DateTime, Integer, LargeBinary, SmallInteger, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
 from app.database import Base
 from app.models.enums import (
+    MATCH_STATUS_CODES, SAMPLE_STATUS_CODES, STOOL_KIT_STATUS_CODES,
     AgeGroup,
     AuditAction, BoxMaterial, BoxType, ConsentType,
     DashboardType, DiscardReason, DiscardRequestStatus, EnrollmentDateSource,
@@ -20,28 +24,106 @@ from app.models.enums import (
     StoolKitStatus, SyncStatus, TransportType, UserRole,
 )
 
+
+class SmallIntEnum(TypeDecorator):
+    """Store a str enum as a SMALLINT code from a fixed member -> code map.
+
+    Binds accept either members or their string values; results come back as
+    enum members, so Python code and API payloads are unchanged.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum], codes: dict):
+        super().__init__()
+        self.enum_class = enum_class
+        # Constructor arguments form the statement cache key, so the map is
+        # kept as a hashable tuple; lookups use the private dicts below
+        self.codes = tuple(codes.items())
+        self._code_for = dict(codes)
+        self.members = {code: member for member, code in codes.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._code_for[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.members[value]
+
+
 # AgeGroup is int enum — stored as INTEGER in PostgreSQL.
+# Hot status enums are stored as SMALLINT codes (SmallIntEnum).
 # All other enums are str enums — stored as VARCHAR(50).
 Base.registry.update_type_annotation_map(
     {
         AgeGroup: Integer(),
+        SampleStatus: SmallIntEnum(SampleStatus, SAMPLE_STATUS_CODES),
+        MatchStatus: SmallIntEnum(MatchStatus, MATCH_STATUS_CODES),
+        StoolKitStatus: SmallIntEnum(StoolKitStatus, STOOL_KIT_STATUS_CODES),
         **{
             t: String(50)
             for t in (
                 AuditAction, BoxMaterial, BoxType, ConsentType,
                 DashboardType, DiscardReason, DiscardRequestStatus, EnrollmentDateSource,
                 EnrollmentSource, FieldEventStatus, FieldEventType, FileCategory,
-                FreezerEventType, FreezerType, IccStatus, InstrumentType, MatchStatus,
+                FreezerEventType, FreezerType, IccStatus, InstrumentType,
                 NotificationSeverity, NotificationType, OdkProcessingStatus, OdkSyncStatus,
                 OdkTriggerType, OmicsResultType, PartnerName, QCStatus, ReportType,
-                RunStatus, RunType, SampleStatus, SampleType, SettingValueType, Sex,
-                StoolKitStatus, SyncStatus, TransportType, UserRole,
+                RunStatus, RunType, SampleType, SettingValueType, Sex,
+                SyncStatus, TransportType, UserRole,
             )
         },
     }
 )
 
 
+class MsgpackBlob(TypeDecorator):
+    """MessagePack-encoded BYTEA for write-once, read-many payloads.
+
+    Decoding msgpack is several times cheaper than JSONB -> dict, and the
+    column is opaque to SQL, so only use it where nothing queries into the
+    payload server-side.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return msgpack.packb(value, use_bin_type=True)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return msgpack.unpackb(value, raw=False)
+
+
+class HexDigest(TypeDecorator):
+    """Raw-bytes BYTEA for a fixed-size digest, exposed to Python as hex.
+
+    Half the size of the hex text on disk and in indexes; callers and API
+    schemas keep working with lowercase hex strings.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return bytes.fromhex(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return bytes(value).hex()
+
+
 class TimestampMixin:
     """Adds created_at and updated_at columns."""
 
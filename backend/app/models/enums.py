@@ -65,6 +65,23 @@ class SampleStatus(str, enum.Enum):
     DISCARDED = "discarded"
 
 
+# Stable SMALLINT storage codes (see SmallIntEnum in base.py). Never renumber
+# or reuse a code: existing rows and partial-index predicates depend on them.
+SAMPLE_STATUS_CODES: dict[SampleStatus, int] = {
+    SampleStatus.REGISTERED: 1,
+    SampleStatus.COLLECTED: 2,
+    SampleStatus.TRANSPORTED: 3,
+    SampleStatus.RECEIVED: 4,
+    SampleStatus.PROCESSING: 5,
+    SampleStatus.STORED: 6,
+    SampleStatus.RESERVED: 7,
+    SampleStatus.IN_ANALYSIS: 8,
+    SampleStatus.PENDING_DISCARD: 9,
+    SampleStatus.DEPLETED: 10,
+    SampleStatus.DISCARDED: 11,
+}
+
+
 class DiscardReason(str, enum.Enum):
     CONTAMINATION = "contamination"
     DEPLETED = "depleted"
@@ -189,6 +206,13 @@ class MatchStatus(str, enum.Enum):
     UNMATCHED = "unmatched"
 
 
+MATCH_STATUS_CODES: dict[MatchStatus, int] = {
+    MatchStatus.AUTO_MATCHED: 1,
+    MatchStatus.MANUAL_MATCHED: 2,
+    MatchStatus.UNMATCHED: 3,
+}
+
+
 class StoolKitStatus(str, enum.Enum):
     ISSUED = "issued"
     PICKUP_SCHEDULED = "pickup_scheduled"
@@ -197,6 +221,15 @@ class StoolKitStatus(str, enum.Enum):
     RESULTS_RECEIVED = "results_received"
 
 
+STOOL_KIT_STATUS_CODES: dict[StoolKitStatus, int] = {
+    StoolKitStatus.ISSUED: 1,
+    StoolKitStatus.PICKUP_SCHEDULED: 2,
+    StoolKitStatus.COLLECTED_BY_DECODEAGE: 3,
+    StoolKitStatus.PROCESSING: 4,
+    StoolKitStatus.RESULTS_RECEIVED: 5,
+}
+
+
 # --- Instrument Enums ---
 
 class InstrumentType(str, enum.Enum):
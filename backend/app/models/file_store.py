@@ -20,7 +20,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import BaseModel, BaseModelNoSoftDelete
+from app.models.base import BaseModel, BaseModelNoSoftDelete, HexDigest
 from app.models.enums import FileCategory
 
 
@@ -31,7 +31,8 @@ class ManagedFile(BaseModel):
     file_name: Mapped[str] = mapped_column(String(500), nullable=False)
     file_size: Mapped[int] = mapped_column(BigInteger, nullable=False)
     mime_type: Mapped[str] = mapped_column(String(200), nullable=False)
-    checksum_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    # 32-byte digest stored as BYTEA; hex string in Python
+    checksum_sha256: Mapped[str] = mapped_column(HexDigest, nullable=False)
     category: Mapped[FileCategory] = mapped_column(nullable=False)
     instrument_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("instrument.id"), nullable=True
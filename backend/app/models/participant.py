@@ -1,5 +1,6 @@
 """Participant, collection site, and consent models."""
 
+import re
 import uuid
 from datetime import date, datetime
 from decimal import Decimal
@@ -13,6 +14,9 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    func,
+    literal_column,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -44,6 +48,19 @@ class CollectionSite(BaseModel):
 
 
 class Participant(BaseModel):
+    """Enrolled study participant.
+
+    Hot numeric ``clinical_data`` keys have expression B-tree indexes so range
+    filters don't scan every row (the GIN/containment path can't serve
+    ``->>`` comparisons). Currently indexed:
+
+    - ``demographics.age`` -> ``ix_participant_age``
+
+    Filter through :meth:`clinical_numeric` so the SQL matches the index
+    expression; add a new index (and migration) before filtering on a
+    new key at scale.
+    """
+
     __tablename__ = "participant"
 
     participant_code: Mapped[str] = mapped_column(
@@ -90,9 +107,31 @@ class Participant(BaseModel):
         Index("ix_participant_group_code", "group_code"),
         Index("ix_participant_site", "collection_site_id"),
         Index("ix_participant_wave", "wave"),
+        Index(
+            "ix_participant_age",
+            text("jsonb_numeric(clinical_data #>> '{demographics,age}')"),
+        ),
         # pg_trgm GIN index for fuzzy search -- created in migration
     )
 
+    @classmethod
+    def clinical_numeric(cls, *path: str):
+        """SQL expression for a numeric ``clinical_data`` value at ``path``.
+
+        The path is rendered as a literal (not a bind param) so the planner
+        can match it against the expression indexes above, so each part
+        must be a plain identifier. Non-numeric values evaluate to NULL
+        rather than raising.
+        """
+        for part in path:
+            if not re.fullmatch(r"\w+", part):
+                raise ValueError(f"Invalid clinical_data path part: {part!r}")
+        json_path = literal_column(f"'{{{','.join(path)}}}'")
+        return func.jsonb_numeric(
+            cls.clinical_data.op("#>>", return_type=Text)(json_path),
+            type_=Numeric,
+        )
+
 
 class Consent(BaseModel):
     __tablename__ = "consent"
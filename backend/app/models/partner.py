@@ -1,9 +1,11 @@
 """Partner integration: ODK, partner lab imports, canonical tests, stool kits."""
 
 import uuid
+from collections.abc import Iterable
 from datetime import date, datetime
 from decimal import Decimal
 
+import orjson
 from sqlalchemy import (
     Date,
     DateTime,
@@ -13,13 +15,19 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    UniqueConstraint,
     func,
+    insert,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB, UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import BaseModel, UUIDPrimaryKeyMixin, Base
+from app.models.base import BaseModel, MsgpackBlob, UUIDPrimaryKeyMixin, Base
 from app.models.enums import (
+    MATCH_STATUS_CODES,
     MatchStatus,
     OdkProcessingStatus,
     OdkSyncStatus,
@@ -28,6 +36,27 @@ from app.models.enums import (
 )
 
 
+async def _execute_in_batches(
+    session: AsyncSession, stmt, rows: Iterable[dict], batch_size: int
+) -> int:
+    """Execute ``stmt`` as one executemany per ``batch_size`` rows.
+
+    The caller owns the transaction. Returns the number of rows sent.
+    """
+    total = 0
+    chunk: list[dict] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= batch_size:
+            await session.execute(stmt, chunk)
+            total += len(chunk)
+            chunk = []
+    if chunk:
+        await session.execute(stmt, chunk)
+        total += len(chunk)
+    return total
+
+
 # --- ODK Integration ---
 
 
@@ -37,7 +66,7 @@ class OdkFormConfig(UUIDPrimaryKeyMixin, Base):
     form_id: Mapped[str] = mapped_column(String(100), nullable=False)
     form_name: Mapped[str] = mapped_column(String(200), nullable=False)
     form_version: Mapped[str] = mapped_column(String(50), nullable=False)
-    field_mapping: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    field_mapping: Mapped[dict] = mapped_column(MsgpackBlob, nullable=False)
     is_active: Mapped[bool] = mapped_column(default=True, server_default="true")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -72,7 +101,12 @@ class OdkSyncLog(UUIDPrimaryKeyMixin, Base):
 
     __table_args__ = (
         Index("ix_odk_sync_log_status", "status"),
-        Index("ix_odk_sync_log_started", "sync_started_at"),
+        Index(
+            "ix_odk_sync_log_started_brin",
+            "sync_started_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -90,7 +124,11 @@ class OdkSubmission(UUIDPrimaryKeyMixin, Base):
     participant_code_raw: Mapped[str | None] = mapped_column(
         String(50), nullable=True
     )
-    submission_data: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Deferred: list views load only the metadata columns; callers that need
+    # the payload add undefer_group("payload")
+    submission_data: Mapped[dict] = mapped_column(
+        JSONB, deferred=True, deferred_group="payload", nullable=False
+    )
     processed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -106,8 +144,27 @@ class OdkSubmission(UUIDPrimaryKeyMixin, Base):
         Index("ix_odk_submission_instance", "odk_instance_id"),
         Index("ix_odk_submission_participant", "participant_id"),
         Index("ix_odk_submission_status", "processing_status"),
+        Index("ix_odk_submission_participant_code_raw", "participant_code_raw"),
     )
 
+    @classmethod
+    async def bulk_upsert(
+        cls,
+        session: AsyncSession,
+        records: Iterable[dict],
+        batch_size: int = 1000,
+    ) -> int:
+        """Insert submission rows, skipping any ``odk_instance_id`` already stored.
+
+        Each chunk of ``batch_size`` records is one
+        ``INSERT ... ON CONFLICT (odk_instance_id) DO NOTHING`` executemany,
+        so a full sync batch costs a handful of round-trips rather than one
+        per submission. Returns the number of records sent (conflicting rows
+        are silently skipped).
+        """
+        stmt = pg_insert(cls).on_conflict_do_nothing(index_elements=["odk_instance_id"])
+        return await _execute_in_batches(session, stmt, records, batch_size)
+
 
 # --- Canonical Test Dictionary ---
 
@@ -164,10 +221,24 @@ class TestNameAlias(UUIDPrimaryKeyMixin, Base):
     canonical_test: Mapped["CanonicalTest"] = relationship(back_populates="aliases")
 
     __table_args__ = (
+        UniqueConstraint("partner_name", "alias_name", name="uq_alias_partner_name"),
         Index("ix_alias_canonical_test", "canonical_test_id"),
         Index("ix_alias_partner", "partner_name"),
     )
 
+    @classmethod
+    async def upsert_many(
+        cls,
+        session: AsyncSession,
+        aliases: Iterable[dict],
+        batch_size: int = 1000,
+    ) -> int:
+        """Insert alias rows, skipping any (partner_name, alias_name) already present."""
+        stmt = pg_insert(cls).on_conflict_do_nothing(
+            index_elements=["partner_name", "alias_name"]
+        )
+        return await _execute_in_batches(session, stmt, aliases, batch_size)
+
 
 # --- Partner Lab Results ---
 
@@ -197,7 +268,12 @@ class PartnerLabImport(UUIDPrimaryKeyMixin, Base):
 
     __table_args__ = (
         Index("ix_partner_import_partner", "partner_name"),
-        Index("ix_partner_import_date", "import_date"),
+        Index(
+            "ix_partner_import_date_brin",
+            "import_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -222,7 +298,9 @@ class PartnerLabResult(UUIDPrimaryKeyMixin, Base):
     test_unit: Mapped[str | None] = mapped_column(String(50), nullable=True)
     reference_range: Mapped[str | None] = mapped_column(String(100), nullable=True)
     is_abnormal: Mapped[bool | None] = mapped_column(nullable=True)
-    raw_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    raw_data: Mapped[dict | None] = mapped_column(
+        JSONB, deferred=True, deferred_group="payload", nullable=True
+    )
     match_status: Mapped[MatchStatus | None] = mapped_column(nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -232,11 +310,107 @@ class PartnerLabResult(UUIDPrimaryKeyMixin, Base):
     import_record: Mapped["PartnerLabImport"] = relationship(back_populates="results")
 
     __table_args__ = (
-        Index("ix_partner_result_import", "import_id"),
-        Index("ix_partner_result_participant", "participant_id"),
+        Index("ix_plr_import_status", "import_id", "match_status"),
+        Index("ix_plr_participant_test_date", "participant_id", "canonical_test_id", "test_date"),
+        # Earliest dated result per participant (enrollment backfill):
+        # MIN(test_date) reads the first index entry for each participant
+        Index(
+            "ix_plr_participant_dated",
+            "participant_id",
+            "test_date",
+            postgresql_where=text("test_date IS NOT NULL"),
+        ),
+        # Data explorer filters on canonical_test_id alone (one test across
+        # all participants), so it keeps its own index
         Index("ix_partner_result_test", "canonical_test_id"),
     )
 
+    @classmethod
+    async def bulk_create(
+        cls,
+        session: AsyncSession,
+        import_id: uuid.UUID,
+        rows: Iterable[dict],
+        batch_size: int = 1000,
+    ) -> int:
+        """Insert result rows for one import without building ORM objects.
+
+        ``rows`` are plain column dicts (``participant_code_raw``,
+        ``test_name_raw``, ...); ``import_id`` is stamped onto each.
+        PostgreSQL shows no gain past ~1000 rows per statement, so that is
+        the default batch size.
+        """
+        return await _execute_in_batches(
+            session,
+            insert(cls),
+            ({**row, "import_id": import_id} for row in rows),
+            batch_size,
+        )
+
+    # Imports larger than this go through COPY; below it, insertmanyvalues
+    # batches are just as fast and keep the normal ORM type processing.
+    COPY_THRESHOLD = 5000
+
+    _COPY_COLUMNS = (
+        "id",
+        "import_id",
+        "participant_id",
+        "participant_code_raw",
+        "test_date",
+        "test_name_raw",
+        "canonical_test_id",
+        "test_value",
+        "test_unit",
+        "reference_range",
+        "is_abnormal",
+        "raw_data",
+        "match_status",
+    )
+
+    @classmethod
+    async def copy_create(
+        cls,
+        session: AsyncSession,
+        import_id: uuid.UUID,
+        rows: Iterable[dict],
+    ) -> int:
+        """Load result rows with a single ``COPY ... FROM STDIN``.
+
+        Bypasses SQLAlchemy entirely (no unit of work, no per-row bind
+        processing), so values must already be driver-ready: UUIDs, dates,
+        and a plain dict for ``raw_data``. ``created_at`` takes its server
+        default. Runs on the session's connection, inside its transaction.
+        Returns the number of rows copied.
+        """
+        records = [
+            (
+                uuid.uuid4(),
+                import_id,
+                row.get("participant_id"),
+                row.get("participant_code_raw"),
+                row.get("test_date"),
+                row.get("test_name_raw"),
+                row.get("canonical_test_id"),
+                row.get("test_value"),
+                row.get("test_unit"),
+                row.get("reference_range"),
+                row.get("is_abnormal"),
+                # jsonb codec on the asyncpg connection takes JSON text
+                orjson.dumps(row["raw_data"]).decode() if row.get("raw_data") is not None else None,
+                # match_status is SMALLINT; COPY skips SmallIntEnum's bind step
+                MATCH_STATUS_CODES[row["match_status"]] if row.get("match_status") is not None else None,
+            )
+            for row in rows
+        ]
+        if not records:
+            return 0
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            cls.__tablename__, records=records, columns=cls._COPY_COLUMNS
+        )
+        return len(records)
+
 
 # --- Stool Kit Tracking ---
 
@@ -250,7 +424,7 @@ class StoolKit(BaseModel):
     field_event_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("field_event.id"), nullable=True
     )
-    kit_code: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    kit_code: Mapped[str | None] = mapped_column(CITEXT, nullable=True)
     issued_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
@@ -270,4 +444,5 @@ class StoolKit(BaseModel):
     __table_args__ = (
         Index("ix_stool_kit_participant", "participant_id"),
         Index("ix_stool_kit_status", "status"),
+        Index("ix_stool_kit_code_hash", "kit_code", postgresql_using="hash"),
     )
@@ -12,8 +12,11 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    cast,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import CITEXT, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel, BaseModelNoSoftDelete
@@ -26,11 +29,26 @@ from app.models.enums import (
 )
 
 
+def _ul_to_centi_ul(value: Decimal | float | str | None) -> int | None:
+    """Convert a microlitre amount to integer hundredths of a microlitre."""
+    if value is None:
+        return None
+    return int((Decimal(str(value)) * 100).to_integral_value())
+
+
+def _centi_ul_to_ul(value: int | None) -> Decimal | None:
+    """Convert integer hundredths of a microlitre back to a microlitre Decimal."""
+    if value is None:
+        return None
+    return Decimal(value).scaleb(-2)
+
+
 class Sample(BaseModel):
     __tablename__ = "sample"
 
+    # citext: barcode scans arrive with sporadic case variation
     sample_code: Mapped[str] = mapped_column(
-        String(30), unique=True, nullable=False
+        CITEXT, unique=True, nullable=False
     )
     participant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("participant.id"), nullable=False
@@ -41,11 +59,14 @@ class Sample(BaseModel):
         UUID(as_uuid=True), ForeignKey("sample.id"), nullable=True
     )
     status: Mapped[SampleStatus] = mapped_column(nullable=False)
-    initial_volume_ul: Mapped[Decimal | None] = mapped_column(
-        Numeric(10, 2), nullable=True
+    # Volumes are stored as integer hundredths of a microlitre (fixed-width
+    # int4 instead of numeric); initial_volume_ul / remaining_volume_ul below
+    # expose them as Decimal uL in Python and SQL.
+    initial_volume_centi_ul: Mapped[int | None] = mapped_column(
+        Integer, nullable=True
     )
-    remaining_volume_ul: Mapped[Decimal | None] = mapped_column(
-        Numeric(10, 2), nullable=True
+    remaining_volume_centi_ul: Mapped[int | None] = mapped_column(
+        Integer, nullable=True
     )
     collection_datetime: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -79,31 +100,78 @@ class Sample(BaseModel):
         UUID(as_uuid=True), ForeignKey("user.id"), nullable=True
     )
 
+    @hybrid_property
+    def initial_volume_ul(self) -> Decimal | None:
+        return _centi_ul_to_ul(self.initial_volume_centi_ul)
+
+    @initial_volume_ul.inplace.setter
+    def _initial_volume_ul_setter(self, value: Decimal | None) -> None:
+        self.initial_volume_centi_ul = _ul_to_centi_ul(value)
+
+    @initial_volume_ul.inplace.expression
+    @classmethod
+    def _initial_volume_ul_expression(cls):
+        return (cast(cls.initial_volume_centi_ul, Numeric(10, 2)) / 100).label(
+            "initial_volume_ul"
+        )
+
+    @hybrid_property
+    def remaining_volume_ul(self) -> Decimal | None:
+        return _centi_ul_to_ul(self.remaining_volume_centi_ul)
+
+    @remaining_volume_ul.inplace.setter
+    def _remaining_volume_ul_setter(self, value: Decimal | None) -> None:
+        self.remaining_volume_centi_ul = _ul_to_centi_ul(value)
+
+    @remaining_volume_ul.inplace.expression
+    @classmethod
+    def _remaining_volume_ul_expression(cls):
+        return (cast(cls.remaining_volume_centi_ul, Numeric(10, 2)) / 100).label(
+            "remaining_volume_ul"
+        )
+
     # Relationships
     participant: Mapped["Participant"] = relationship(  # noqa: F821
         "Participant", back_populates="samples"
     )
+    # Aliquot links raise on implicit lazy load: callers must opt in with
+    # selectinload (one batched query per level) rather than walk the tree
     parent_sample: Mapped["Sample | None"] = relationship(
-        "Sample", remote_side="Sample.id", back_populates="aliquots"
+        "Sample", remote_side="Sample.id", back_populates="aliquots", lazy="raise"
     )
     aliquots: Mapped[list["Sample"]] = relationship(
-        "Sample", back_populates="parent_sample"
+        "Sample", back_populates="parent_sample", lazy="raise"
     )
+    # Newest first: the order every timeline view presents
     status_history: Mapped[list["SampleStatusHistory"]] = relationship(
-        back_populates="sample"
+        back_populates="sample",
+        order_by="SampleStatusHistory.changed_at.desc()",
     )
     storage_position: Mapped["StoragePosition | None"] = relationship(  # noqa: F821
         "StoragePosition", foreign_keys=[storage_location_id]
     )
 
     __table_args__ = (
-        Index("ix_sample_code", "sample_code"),
+        # sample_code equality is served by the unique constraint's index
         Index("ix_sample_participant", "participant_id"),
         Index("ix_sample_type", "sample_type"),
-        Index("ix_sample_status", "status"),
+        # Partial indexes: terminal (depleted/discarded) samples are the long
+        # tail of history and are excluded from the operational status index.
+        # Predicates use SAMPLE_STATUS_CODES: 9 pending_discard, 10 depleted,
+        # 11 discarded.
+        Index(
+            "ix_sample_status_active",
+            "status",
+            postgresql_where=text("status NOT IN (10, 11)"),
+        ),
+        Index(
+            "ix_sample_pending_discard",
+            "participant_id",
+            postgresql_where=text("status = 9"),
+        ),
         Index("ix_sample_parent", "parent_sample_id"),
         Index("ix_sample_wave", "wave"),
-        # pg_trgm GIN index for fuzzy search -- created in migration
+        # pg_trgm GIN index on (sample_code::text) for fuzzy search -- created in migration
     )
 
 
@@ -132,7 +200,12 @@ class SampleStatusHistory(BaseModelNoSoftDelete):
 
     __table_args__ = (
         Index("ix_sample_status_history_sample", "sample_id"),
-        Index("ix_sample_status_history_changed_at", "changed_at"),
+        Index(
+            "ix_sample_status_history_changed_at_brin",
+            "changed_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -226,4 +299,16 @@ class SampleTransportItem(BaseModelNoSoftDelete):
 
     __table_args__ = (
         Index("ix_transport_item_transport", "transport_id"),
+        # An item references either a sample or a box, so each FK index is
+        # partial on its non-NULL half
+        Index(
+            "ix_transport_item_sample",
+            "sample_id",
+            postgresql_where=text("sample_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_transport_item_box",
+            "box_id",
+            postgresql_where=text("box_id IS NOT NULL"),
+        ),
     )
@@ -14,6 +14,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -31,6 +32,14 @@ class Freezer(BaseModel):
     total_capacity: Mapped[int | None] = mapped_column(Integer, nullable=True)
     rack_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     slots_per_rack: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Maintained by the trg_storage_position_freezer_counts trigger -- never
+    # written by the application
+    total_positions: Mapped[int] = mapped_column(
+        Integer, server_default="0", nullable=False
+    )
+    occupied_positions: Mapped[int] = mapped_column(
+        Integer, server_default="0", nullable=False
+    )
     is_active: Mapped[bool] = mapped_column(default=True, server_default="true")
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_by: Mapped[uuid.UUID | None] = mapped_column(
@@ -84,7 +93,12 @@ class FreezerTemperatureEvent(UUIDPrimaryKeyMixin, Base):
 
     __table_args__ = (
         Index("ix_temp_event_freezer", "freezer_id"),
-        Index("ix_temp_event_start", "event_start"),
+        Index(
+            "ix_temp_event_start_brin",
+            "event_start",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -146,6 +160,15 @@ class StoragePosition(UUIDPrimaryKeyMixin, Base):
     box_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("storage_box.id"), nullable=False
     )
+    # Denormalized from box -> rack -> freezer so sample location lookups skip
+    # the 3-hop join. Kept in sync by triggers on storage_box / storage_rack
+    # (see migration 013).
+    rack_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("storage_rack.id"), nullable=False
+    )
+    freezer_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("freezer.id"), nullable=False
+    )
     row: Mapped[int] = mapped_column(Integer, nullable=False)
     column: Mapped[int] = mapped_column(Integer, nullable=False)
     sample_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -166,6 +189,20 @@ class StoragePosition(UUIDPrimaryKeyMixin, Base):
 
     __table_args__ = (
         UniqueConstraint("box_id", "row", "column", name="uq_box_row_col"),
-        Index("ix_position_box", "box_id"),
-        Index("ix_position_sample", "sample_id"),
+        # Covering index so box-grid reads are index-only scans
+        Index(
+            "ix_position_box_covering",
+            "box_id",
+            postgresql_include=["row", "column", "sample_id", "occupied_at"],
+        ),
+        # Empty slots dominate under-filled boxes; only occupied ones are indexed
+        Index(
+            "ix_position_sample",
+            "sample_id",
+            postgresql_where=text("sample_id IS NOT NULL"),
+        ),
+        Index("ix_position_freezer", "freezer_id"),
+        # fillfactor=70 (page headroom for sample moves) and
+        # autovacuum_vacuum_scale_factor=0.02 (keeps the visibility map fresh
+        # for index-only scans) -- set in migration
     )
@@ -16,7 +16,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import UUIDPrimaryKeyMixin, Base
+from app.models.base import MsgpackBlob, UUIDPrimaryKeyMixin, Base
 from app.models.enums import DashboardType, ReportType, SettingValueType
 
 
@@ -47,7 +47,7 @@ class ScheduledReport(UUIDPrimaryKeyMixin, Base):
     report_name: Mapped[str] = mapped_column(String(200), nullable=False)
     report_type: Mapped[ReportType] = mapped_column(nullable=False)
     schedule_cron: Mapped[str] = mapped_column(String(50), nullable=False)
-    recipients: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    recipients: Mapped[list[str]] = mapped_column(JSONB, nullable=False)
     filters: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     last_generated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -68,7 +68,9 @@ class DashboardCache(UUIDPrimaryKeyMixin, Base):
     __tablename__ = "dashboard_cache"
 
     dashboard_type: Mapped[DashboardType] = mapped_column(nullable=False)
-    cache_data: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    cache_data: Mapped[dict] = mapped_column(
+        MsgpackBlob, deferred=True, deferred_group="payload", nullable=False
+    )
     computed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
@@ -79,4 +81,6 @@ class DashboardCache(UUIDPrimaryKeyMixin, Base):
 
     __table_args__ = (
         Index("ix_dashboard_cache_type", "dashboard_type"),
+        # cache_data: lz4 compression + toast_tuple_target=128 -- set in migration
+        # UNLOGGED (regenerable; emptied after a crash) -- set in migration
     )
@@ -3,8 +3,8 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func, text
+from sqlalchemy.dialects.postgresql import INET, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel, UUIDPrimaryKeyMixin, Base
@@ -24,9 +24,9 @@ class User(BaseModel):
         UUID(as_uuid=True), ForeignKey("user.id"), nullable=True
     )
 
-    # Relationships
+    # Relationships -- raise_on_sql: load explicitly with selectinload()
     sessions: Mapped[list["UserSession"]] = relationship(
-        back_populates="user", cascade="all, delete-orphan"
+        back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
 
     __table_args__ = (
@@ -42,7 +42,7 @@ class UserSession(UUIDPrimaryKeyMixin, Base):
         UUID(as_uuid=True), ForeignKey("user.id"), nullable=False
     )
     token_hash: Mapped[str] = mapped_column(String(255), nullable=False)
-    ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
+    ip_address: Mapped[str | None] = mapped_column(INET, nullable=True)
     user_agent: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -55,11 +55,20 @@ class UserSession(UUIDPrimaryKeyMixin, Base):
     )
 
     # Relationships
-    user: Mapped["User"] = relationship(back_populates="sessions")
+    user: Mapped["User"] = relationship(back_populates="sessions", lazy="raise_on_sql")
 
     __table_args__ = (
         Index("ix_user_session_user_id", "user_id"),
-        Index("ix_user_session_token_hash", "token_hash"),
+        # Live sessions only: every authenticated request looks up its token
+        # with revoked_at IS NULL AND expires_at > now()
+        Index(
+            "ix_user_session_token_hash_live",
+            "token_hash",
+            "expires_at",
+            postgresql_where=text("revoked_at IS NULL"),
+        ),
+        # Range scan for the expired-session purge (revoked rows included)
+        Index("ix_user_session_expires_at", "expires_at"),
     )
 
 
@@ -76,15 +85,42 @@ class AuditLog(UUIDPrimaryKeyMixin, Base):
     )
     old_values: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     new_values: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
+    ip_address: Mapped[str | None] = mapped_column(INET, nullable=True)
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     additional_context: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     __table_args__ = (
-        Index("ix_audit_log_entity", "entity_type", "entity_id"),
-        Index("ix_audit_log_user_id", "user_id"),
+        # (filter, sort) composites: entity history and per-user activity are
+        # read newest-first. They also serve the plain entity/user filters.
+        Index(
+            "ix_audit_log_entity_timestamp",
+            "entity_type",
+            "entity_id",
+            "timestamp",
+            postgresql_ops={"timestamp": "DESC"},
+        ),
+        Index(
+            "ix_audit_log_user_timestamp",
+            "user_id",
+            "timestamp",
+            postgresql_ops={"timestamp": "DESC"},
+        ),
         Index("ix_audit_log_timestamp", "timestamp"),
         Index("ix_audit_log_action", "action"),
+        # jsonb_path_ops GIN: serves only @> containment, at about half the
+        # size of the default jsonb_ops
+        Index(
+            "ix_audit_log_old_values_gin",
+            "old_values",
+            postgresql_using="gin",
+            postgresql_ops={"old_values": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_audit_log_new_values_gin",
+            "new_values",
+            postgresql_using="gin",
+            postgresql_ops={"new_values": "jsonb_path_ops"},
+        ),
     )
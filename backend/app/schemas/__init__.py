@@ -1,18 +1,37 @@
 """Shared schema utilities."""
 
-from pydantic import BaseModel
+from typing import Generic, TypeVar
 
+from pydantic import BaseModel, ConfigDict
 
-class APIResponse(BaseModel):
-    """Standard API response wrapper."""
+# Shared config for *Read schemas built from ORM instances. extra="ignore",
+# defer_build=False and revalidate_instances="never" are pydantic's defaults
+# already, so only from_attributes needs setting.
+READ_CONFIG = ConfigDict(from_attributes=True)
+
+
+T = TypeVar("T")
+
+
+class APIResponse(BaseModel, Generic[T]):
+    """Standard API response wrapper.
+
+    Parametrize with the payload type (``APIResponse[FieldEventRead]``,
+    ``APIResponse[list[SampleRead]]``); pydantic builds and caches one
+    monomorphic schema per parametrization.
+    """
     success: bool = True
-    data: dict | list | None = None
+    data: T | None = None
     meta: dict | None = None
     error: dict | None = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class PaginationMeta(BaseModel):
     page: int
     per_page: int
     total: int
     total_pages: int
+
+    model_config = ConfigDict(frozen=True)
@@ -1,23 +1,53 @@
 """Authentication request/response schemas."""
 
 import re
+from typing import Annotated
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import AfterValidator, BaseModel, Field, field_validator
+
+
+# One pass for the common (valid) case; the per-rule patterns run only on
+# failure, to pick the error message.
+_PASSWORD_COMPLEXITY_RE = re.compile(r"(?=.*[A-Z])(?=.*[a-z])(?=.*\d)", re.DOTALL)
+_PASSWORD_RULES = (
+    (re.compile(r"[A-Z]"), "Password must contain at least one uppercase letter."),
+    (re.compile(r"[a-z]"), "Password must contain at least one lowercase letter."),
+    (re.compile(r"\d"), "Password must contain at least one digit."),
+)
 
 
 def _validate_password_complexity(v: str) -> str:
     """Enforce password complexity: 1 uppercase, 1 lowercase, 1 digit, min 8 chars."""
-    if not re.search(r"[A-Z]", v):
-        raise ValueError("Password must contain at least one uppercase letter.")
-    if not re.search(r"[a-z]", v):
-        raise ValueError("Password must contain at least one lowercase letter.")
-    if not re.search(r"\d", v):
-        raise ValueError("Password must contain at least one digit.")
+    if _PASSWORD_COMPLEXITY_RE.match(v):
+        return v
+    for pattern, message in _PASSWORD_RULES:
+        if not pattern.search(v):
+            raise ValueError(message)
     return v
 
 
+_LOOKUP_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _validate_lookup_email(v: str) -> str:
+    """Cheap syntactic check for emails that are only used to look up a user.
+
+    Accounts are created through ``UserCreate`` (full ``EmailStr`` validation),
+    so login and password-reset only need a well-formed address. The domain is
+    lowercased to match how ``EmailStr`` normalised the stored value.
+    """
+    v = v.strip()
+    if not _LOOKUP_EMAIL_RE.fullmatch(v):
+        raise ValueError("value is not a valid email address")
+    local, _, domain = v.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+LookupEmail = Annotated[str, AfterValidator(_validate_lookup_email)]
+
+
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: LookupEmail
     password: str = Field(min_length=1)
 
 
@@ -44,7 +74,7 @@ class ChangePasswordRequest(BaseModel):
 
 
 class ForgotPasswordRequest(BaseModel):
-    email: EmailStr
+    email: LookupEmail
 
 
 class ResetPasswordRequest(BaseModel):
@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import date, datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -11,6 +12,7 @@ from app.models.enums import (
     PartnerName,
     SyncStatus,
 )
+from app.schemas import READ_CONFIG
 
 
 # --- Field Event ---
@@ -57,7 +59,7 @@ class FieldEventRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class EventParticipantRead(BaseModel):
@@ -79,7 +81,7 @@ class EventParticipantRead(BaseModel):
     # Computed: set by service layer when joining with participant
     participant_code: str | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class FieldEventDetail(FieldEventRead):
@@ -109,7 +111,9 @@ class CheckInRequest(BaseModel):
 class BulkDigitizeItem(BaseModel):
     participant_id: uuid.UUID
     check_in_time: datetime | None = None
-    samples_collected: dict | None = None
+    # Sample-type flags from the paper form ({"blood": true, "urine": false, ...}).
+    # Keys stay open: the set of collected sample types varies by protocol.
+    samples_collected: dict[str, bool] | None = None
     partner_samples: dict | None = None
     stool_kit_issued: bool = False
     urine_collected: bool = False
@@ -133,5 +137,5 @@ class SyncConflict(BaseModel):
 
 class SyncResolveRequest(BaseModel):
     offline_id: str
-    resolution: str = Field(description="'server' or 'client'")
+    resolution: Literal["server", "client"]
     field: str | None = None
@@ -9,6 +9,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from app.models.enums import FileCategory
+from app.schemas import READ_CONFIG
 
 
 # -- ManagedFile --
@@ -31,7 +32,7 @@ class ManagedFileRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class ManagedFileCreate(BaseModel):
@@ -40,7 +41,7 @@ class ManagedFileCreate(BaseModel):
     file_name: str = Field(min_length=1, max_length=500)
     file_size: int = Field(ge=0)
     mime_type: str = Field(max_length=200)
-    checksum_sha256: str = Field(min_length=64, max_length=64)
+    checksum_sha256: str = Field(pattern=r"^[0-9a-fA-F]{64}$")
     category: FileCategory = FileCategory.INSTRUMENT_OUTPUT
     instrument_id: uuid.UUID | None = None
 
@@ -74,7 +75,7 @@ class WatchDirectoryRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class WatchDirectoryUpdate(BaseModel):
@@ -14,6 +14,7 @@ from app.models.enums import (
     RunStatus,
     RunType,
 )
+from app.schemas import READ_CONFIG
 
 
 # ── Instrument ────────────────────────────────────────────────────────
@@ -56,7 +57,7 @@ class InstrumentRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ── QC Template ───────────────────────────────────────────────────────
@@ -78,7 +79,7 @@ class QCTemplateRead(BaseModel):
     created_at: datetime
     created_by: uuid.UUID | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ── Plate ─────────────────────────────────────────────────────────────
@@ -103,7 +104,7 @@ class PlateRead(BaseModel):
     created_at: datetime
     created_by: uuid.UUID | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class RunSampleRead(BaseModel):
@@ -116,13 +117,15 @@ class RunSampleRead(BaseModel):
     sample_order: int | None
     is_qc_sample: bool
     qc_type: str | None
-    injection_volume_ul: Decimal | None
-    volume_withdrawn_ul: Decimal | None
+    # float, not Decimal: response-only, and serialized as a JSON number to
+    # match the frontend types
+    injection_volume_ul: float | None
+    volume_withdrawn_ul: float | None
     created_at: datetime
     # Joined fields (optional, set by service)
     sample_code: str | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class PlateDetail(PlateRead):
@@ -188,7 +191,7 @@ class TecanWorklistRow(BaseModel):
     source_position: str
     dest_rack: str
     dest_position: str
-    volume_ul: Decimal
+    volume_ul: float
 
 
 class TecanWorklistResponse(BaseModel):
@@ -245,7 +248,7 @@ class InstrumentRunRead(BaseModel):
     plate_count: int = 0
     sample_count: int = 0
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ── Run Results Upload ────────────────────────────────────────────────
@@ -285,7 +288,7 @@ class OmicsResultSetRead(BaseModel):
     notes: str | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class OmicsResultRead(BaseModel):
@@ -301,7 +304,7 @@ class OmicsResultRead(BaseModel):
     # Joined fields
     sample_code: str | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ── ICC Processing ────────────────────────────────────────────────────
@@ -350,4 +353,4 @@ class IccProcessingRead(BaseModel):
     # Joined fields
     sample_code: str | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
@@ -1,7 +1,12 @@
 """Schemas for label generation requests."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
+# Mirrors LABEL_GROUPS in app.services.label_generator
+LabelGroup = Literal["cryovial", "epigenetics", "samples", "edta", "sst_fl_blood", "urine"]
+
 
 class LabelGenerateRequest(BaseModel):
     """Request to generate labels for a set of participants."""
@@ -16,9 +21,8 @@ class LabelGenerateRequest(BaseModel):
         default="",
         description="Optional date string appended to filenames",
     )
-    output_format: str = Field(
+    output_format: Literal["docx", "pdf"] = Field(
         default="docx",
-        pattern=r"^(docx|pdf)$",
         description="Output format: docx or pdf",
     )
 
@@ -31,8 +35,7 @@ class SingleGroupLabelRequest(BaseModel):
         min_length=1,
         max_length=500,
     )
-    group: str = Field(
+    group: LabelGroup = Field(
         ...,
-        pattern=r"^(cryovial|epigenetics|samples|edta|sst_fl_blood|urine)$",
         description="Label group: cryovial, epigenetics, samples, edta, sst_fl_blood, or urine",
     )
@@ -6,6 +6,7 @@ from datetime import datetime
 from pydantic import BaseModel
 
 from app.models.enums import NotificationSeverity, NotificationType, UserRole
+from app.schemas import READ_CONFIG
 
 
 class NotificationRead(BaseModel):
@@ -24,4 +25,4 @@ class NotificationRead(BaseModel):
     created_at: datetime
     expires_at: datetime | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
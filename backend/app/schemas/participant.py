@@ -7,6 +7,7 @@ from decimal import Decimal
 from pydantic import BaseModel, Field
 
 from app.models.enums import AgeGroup, ConsentType, EnrollmentSource, Sex
+from app.schemas import READ_CONFIG
 
 
 # --- Collection Site ---
@@ -40,7 +41,7 @@ class CollectionSiteRead(BaseModel):
     is_active: bool
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # --- Participant ---
@@ -87,7 +88,7 @@ class ParticipantRead(BaseModel):
     age_source: str | None = None   # "dob_enrollment" | "odk" | "unknown"
     age_group_mismatch: bool = False
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class ParticipantDetail(ParticipantRead):
@@ -130,4 +131,9 @@ class ConsentRead(BaseModel):
     withdrawal_reason: str | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
+
+
+# ParticipantDetail forward-references ConsentRead; resolve it at import so
+# the first detail request does not pay for the schema build.
+ParticipantDetail.model_rebuild()
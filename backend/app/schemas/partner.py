@@ -4,7 +4,7 @@ import uuid
 from datetime import date, datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.models.enums import (
     MatchStatus,
@@ -13,6 +13,7 @@ from app.models.enums import (
     PartnerName,
     StoolKitStatus,
 )
+from app.schemas import READ_CONFIG
 
 
 # ---------------------------------------------------------------------------
@@ -23,12 +24,13 @@ class OdkFormConfigCreate(BaseModel):
     form_id: str = Field(min_length=1, max_length=100)
     form_name: str = Field(min_length=1, max_length=200)
     form_version: str = Field(min_length=1, max_length=50)
-    field_mapping: dict
+    # ODK field name -> LIIMS field name
+    field_mapping: dict[str, str]
 
 
 class OdkFormConfigUpdate(BaseModel):
     form_name: str | None = None
-    field_mapping: dict | None = None
+    field_mapping: dict[str, str] | None = None
     is_active: bool | None = None
 
 
@@ -42,7 +44,7 @@ class OdkFormConfigRead(BaseModel):
     created_at: datetime
     updated_by: uuid.UUID | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class OdkSyncLogRead(BaseModel):
@@ -57,7 +59,7 @@ class OdkSyncLogRead(BaseModel):
     error_message: str | None
     created_by: uuid.UUID | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class OdkSubmissionRead(BaseModel):
@@ -67,13 +69,16 @@ class OdkSubmissionRead(BaseModel):
     odk_form_version: str | None
     participant_id: uuid.UUID | None
     participant_code_raw: str | None
-    submission_data: dict
     processed_at: datetime | None
     processing_status: OdkProcessingStatus | None
     error_message: str | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
+
+
+class OdkSubmissionDetail(OdkSubmissionRead):
+    submission_data: dict
 
 
 class OdkSyncTriggerRequest(BaseModel):
@@ -109,14 +114,16 @@ class CanonicalTestRead(BaseModel):
     display_name: str | None
     category: str | None
     standard_unit: str | None
-    reference_range_low: Decimal | None
-    reference_range_high: Decimal | None
+    # float, not Decimal: response-only, and serialized as a JSON number to
+    # match the frontend types
+    reference_range_low: float | None
+    reference_range_high: float | None
     is_active: bool
     created_at: datetime
     updated_by: uuid.UUID | None
     aliases_count: int = 0
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class TestNameAliasCreate(BaseModel):
@@ -132,10 +139,12 @@ class TestNameAliasRead(BaseModel):
     partner_name: PartnerName
     alias_name: str
     alias_unit: str | None
-    unit_conversion_factor: Decimal
+    # float, not Decimal: response-only, and serialized as a JSON number to
+    # match the frontend types
+    unit_conversion_factor: float
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ---------------------------------------------------------------------------
@@ -160,7 +169,8 @@ class ImportPreviewResponse(BaseModel):
 
 
 class ImportConfigureRequest(BaseModel):
-    field_mapping: dict
+    # Source column -> result field
+    field_mapping: dict[str, str]
     test_name_mapping: dict[str, uuid.UUID] | None = None
 
 
@@ -184,7 +194,7 @@ class PartnerLabImportRead(BaseModel):
     notes: str | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class PartnerLabResultRead(BaseModel):
@@ -199,12 +209,20 @@ class PartnerLabResultRead(BaseModel):
     test_unit: str | None
     reference_range: str | None
     is_abnormal: bool | None
-    raw_data: dict | None
     match_status: MatchStatus | None
     created_at: datetime
     canonical_test_name: str | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
+
+
+class PartnerLabResultDetail(PartnerLabResultRead):
+    raw_data: dict | None
+
+
+class PartnerLabImportDetail(PartnerLabImportRead):
+    """Import with its results, including each row's raw payload."""
+    results: list[PartnerLabResultDetail] = []
 
 
 # ---------------------------------------------------------------------------
@@ -237,4 +255,10 @@ class StoolKitRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
+
+
+# List adapters: validate and dump a whole page in one pydantic-core call
+# instead of one model_validate/model_dump round trip per row.
+PartnerLabResultReadListAdapter = TypeAdapter(list[PartnerLabResultRead])
+StoolKitReadListAdapter = TypeAdapter(list[StoolKitRead])
@@ -1,13 +1,34 @@
 """Schemas for the query builder endpoints."""
 
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+# Mirrors ALLOWED_OPERATORS in app.services.query_builder
+FilterOperator = Literal[
+    "eq", "ne", "gt", "lt", "gte", "lte", "like", "contains", "starts_with",
+    "in", "is_null", "between",
+]
 
 
 class QueryFilter(BaseModel):
     field: str = Field(min_length=1, max_length=100)
-    operator: str = Field(min_length=1, max_length=20)
+    operator: FilterOperator
     value: str | int | float | bool | list | None = None
 
+    @model_validator(mode="after")
+    def check_value_shape(self) -> "QueryFilter":
+        """List operators need a list; the comparison operators need a scalar."""
+        if self.operator == "between":
+            if not isinstance(self.value, list) or len(self.value) != 2:
+                raise ValueError("'between' operator requires a list with exactly 2 values.")
+        elif self.operator == "in":
+            if not isinstance(self.value, list):
+                raise ValueError("'in' operator requires a list value.")
+        elif isinstance(self.value, list):
+            raise ValueError(f"'{self.operator}' operator requires a single value.")
+        return self
+
 
 class QueryRequest(BaseModel):
     entity: str = Field(min_length=1, max_length=50)
@@ -2,10 +2,13 @@
 
 import uuid
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from croniter import croniter
+from pydantic import AfterValidator, BaseModel, EmailStr, Field
 
 from app.models.enums import ReportType
+from app.schemas import READ_CONFIG
 
 
 # ── On-demand report generation ───────────────────────────────────────
@@ -17,14 +20,32 @@ class ReportGenerateRequest(BaseModel):
 
 # ── Scheduled reports CRUD ────────────────────────────────────────────
 
+def _validate_cron(v: str) -> str:
+    """Reject expressions the report beat task could never schedule.
+
+    ``_is_due`` in ``app.tasks.reports`` parses the stored expression with
+    croniter on every run and silently skips reports it cannot parse.
+    """
+    if not croniter.is_valid(v):
+        raise ValueError("invalid cron expression")
+    return v
+
+
+CronExpression = Annotated[
+    str,
+    Field(
+        min_length=1, max_length=50,
+        description="Cron expression, e.g. '0 8 * * 1' for weekly Monday 8 AM",
+    ),
+    AfterValidator(_validate_cron),
+]
+
+
 class ScheduledReportCreate(BaseModel):
     report_name: str = Field(min_length=1, max_length=200)
     report_type: ReportType
-    schedule_cron: str = Field(
-        min_length=1, max_length=50,
-        description="Cron expression, e.g. '0 8 * * 1' for weekly Monday 8 AM",
-    )
-    recipients: list[str] = Field(
+    schedule_cron: CronExpression
+    recipients: list[EmailStr] = Field(
         min_length=1,
         description="List of email addresses",
     )
@@ -33,8 +54,8 @@ class ScheduledReportCreate(BaseModel):
 
 class ScheduledReportUpdate(BaseModel):
     report_name: str | None = None
-    schedule_cron: str | None = None
-    recipients: list[str] | None = None
+    schedule_cron: CronExpression | None = None
+    recipients: list[EmailStr] | None = None
     filters: dict | None = None
     is_active: bool | None = None
 
@@ -44,7 +65,7 @@ class ScheduledReportRead(BaseModel):
     report_name: str
     report_type: ReportType
     schedule_cron: str
-    recipients: dict  # stored as JSONB, comes back as list
+    recipients: list[str]
     filters: dict | None
     last_generated_at: datetime | None
     last_sent_at: datetime | None
@@ -52,4 +73,4 @@ class ScheduledReportRead(BaseModel):
     created_at: datetime
     created_by: uuid.UUID | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.models.enums import (
     DiscardReason,
@@ -13,6 +13,7 @@ from app.models.enums import (
     SampleType,
     TransportType,
 )
+from app.schemas import READ_CONFIG
 
 
 # --- Sample ---
@@ -54,8 +55,10 @@ class SampleRead(BaseModel):
     sample_subtype: str | None
     parent_sample_id: uuid.UUID | None
     status: SampleStatus
-    initial_volume_ul: Decimal | None
-    remaining_volume_ul: Decimal | None
+    # float, not Decimal: response-only, and serialized as a JSON number to
+    # match the frontend types
+    initial_volume_ul: float | None
+    remaining_volume_ul: float | None
     collection_datetime: datetime | None
     processing_started_at: datetime | None
     storage_location_id: uuid.UUID | None
@@ -67,7 +70,7 @@ class SampleRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class SampleDetail(SampleRead):
@@ -88,7 +91,7 @@ class StatusHistoryRead(BaseModel):
     location_context: str | None
     storage_rule_override_reason: str | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # --- Discard ---
@@ -110,7 +113,7 @@ class DiscardRequestRead(BaseModel):
     status: DiscardRequestStatus
     rejection_reason: str | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class DiscardApprovalRequest(BaseModel):
@@ -151,4 +154,13 @@ class TransportRead(BaseModel):
     notes: str | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
+
+
+# SampleDetail forward-references StatusHistoryRead; resolve it at import so
+# the first detail request does not pay for the schema build.
+SampleDetail.model_rebuild()
+
+# List adapters: validate and dump a whole page in one pydantic-core call
+# instead of one model_validate/model_dump round trip per row.
+SampleReadListAdapter = TypeAdapter(list[SampleRead])
@@ -4,9 +4,10 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.models.enums import BoxMaterial, BoxType, FreezerEventType, FreezerType
+from app.schemas import READ_CONFIG
 
 
 # --- Freezer ---
@@ -48,7 +49,7 @@ class FreezerRead(BaseModel):
     total_positions: int = 0
     utilization_pct: float = 0.0
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # --- StorageRack ---
@@ -73,7 +74,7 @@ class RackRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # --- StorageBox ---
@@ -120,7 +121,7 @@ class BoxRead(BaseModel):
     occupied_count: int = 0
     total_slots: int = 0
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # --- StoragePosition ---
@@ -136,7 +137,7 @@ class PositionRead(BaseModel):
     locked_at: datetime | None
     sample_code: str | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class BoxDetail(BoxRead):
@@ -185,14 +186,16 @@ class TempEventRead(BaseModel):
     event_type: FreezerEventType
     event_start: datetime
     event_end: datetime | None
-    observed_temp_c: Decimal | None
+    # float, not Decimal: response-only, and serialized as a JSON number to
+    # match the frontend types
+    observed_temp_c: float | None
     reported_by: uuid.UUID
     samples_affected_count: int | None
     resolution_notes: str | None
     requires_sample_review: bool
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class TempEventResolve(BaseModel):
@@ -215,3 +218,9 @@ class StorageSearchResult(BaseModel):
     rack_name: str
     freezer_id: uuid.UUID
     freezer_name: str
+
+
+# List adapters: validate and dump a whole page in one pydantic-core call
+# instead of one model_validate/model_dump round trip per row.
+BoxReadListAdapter = TypeAdapter(list[BoxRead])
+PositionReadListAdapter = TypeAdapter(list[PositionRead])
@@ -9,7 +9,7 @@ class SyncMutation(BaseModel):
     id: str = Field(description="Client-generated unique ID for this mutation")
     type: str = Field(description="Mutation type (e.g., participant_checkin, sample_register)")
     entity_id: str | None = Field(default=None, description="ID of the entity being mutated")
-    timestamp: str = Field(description="ISO timestamp when mutation was created on client")
+    timestamp: datetime = Field(description="ISO timestamp when mutation was created on client")
     payload: dict = Field(default_factory=dict, description="Mutation-specific data")
 
 
@@ -6,6 +6,7 @@ from datetime import datetime
 from pydantic import BaseModel, field_validator
 
 from app.models.enums import SettingValueType
+from app.schemas import READ_CONFIG
 
 
 class SystemSettingRead(BaseModel):
@@ -18,7 +19,7 @@ class SystemSettingRead(BaseModel):
     updated_at: datetime
     updated_by: uuid.UUID | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class SystemSettingUpdate(BaseModel):
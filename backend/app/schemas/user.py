@@ -6,6 +6,7 @@ from datetime import datetime
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
 from app.models.enums import UserRole
+from app.schemas import READ_CONFIG
 from app.schemas.auth import _validate_password_complexity
 
 
@@ -36,7 +37,7 @@ class UserRead(BaseModel):
     last_login: datetime | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 class UserListResponse(BaseModel):
@@ -26,10 +26,20 @@ import argparse
 import asyncio
 import logging
 import sys
-from collections import Counter
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
-from sqlalchemy import func, select, update
+from sqlalchemy import (
+    Date,
+    DateTime,
+    any_,
+    bindparam,
+    func,
+    null,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 
 # Ensure UTF-8 output on Windows
 if hasattr(sys.stdout, "reconfigure"):
@@ -51,21 +61,27 @@ async def run_backfill(dry_run: bool = False) -> None:
 
     async with async_session_factory() as db:
         # ── Step 1: Detect bulk import sentinel date ─────────────────
-        dates_q = select(Participant.enrollment_date).where(
-            Participant.is_deleted == False  # noqa: E712
+        # The sentinel is the most common enrollment_date (bulk import date),
+        # grouped by UTC day to ignore sub-second variance. Postgres computes
+        # the mode and returns a single row. The value is shifted to UTC first
+        # so the day does not depend on the session's TimeZone setting.
+        enrollment_day = func.date_trunc(
+            "day", func.timezone("UTC", Participant.enrollment_date)
+        ).label("d")
+        sentinel_q = (
+            select(enrollment_day, func.count().label("c"))
+            .where(Participant.is_deleted == False)  # noqa: E712
+            .group_by(enrollment_day)
+            .order_by(func.count().desc())
+            .limit(1)
         )
-        date_rows = (await db.execute(dates_q)).scalars().all()
-        if not date_rows:
+        sentinel_row = (await db.execute(sentinel_q)).first()
+        if sentinel_row is None or sentinel_row.d is None:
             logger.info("No participants found. Nothing to do.")
             return
 
-        # The sentinel is the most common enrollment_date (bulk import date)
-        counter: Counter = Counter()
-        for d in date_rows:
-            # Normalize to date-only for grouping (ignore sub-second variance)
-            key = d.date() if hasattr(d, "date") else d
-            counter[key] += 1
-        sentinel_date, sentinel_count = counter.most_common(1)[0]
+        sentinel_date = sentinel_row.d.date()
+        sentinel_count = sentinel_row.c
         logger.info(
             "Detected bulk import sentinel date: %s (%d participants)",
             sentinel_date,
@@ -77,16 +93,18 @@ async def run_backfill(dry_run: bool = False) -> None:
             sentinel_date.year, sentinel_date.month, sentinel_date.day,
             tzinfo=timezone.utc,
         )
-        sentinel_dt_end = datetime(
-            sentinel_date.year, sentinel_date.month, sentinel_date.day,
-            23, 59, 59, tzinfo=timezone.utc,
-        )
+        sentinel_dt_end = sentinel_dt_start + timedelta(days=1)
         candidates_q = (
-            select(Participant.id, Participant.participant_code, Participant.enrollment_date)
+            select(
+                Participant.id,
+                Participant.participant_code,
+                Participant.enrollment_date,
+                Participant.enrollment_date_source,
+            )
             .where(
                 Participant.is_deleted == False,  # noqa: E712
                 Participant.enrollment_date >= sentinel_dt_start,
-                Participant.enrollment_date <= sentinel_dt_end,
+                Participant.enrollment_date < sentinel_dt_end,
             )
         )
         candidate_rows = (await db.execute(candidates_q)).all()
@@ -97,53 +115,77 @@ async def run_backfill(dry_run: bool = False) -> None:
             logger.info("No candidates found. Nothing to do.")
             return
 
-        # ── Step 3: Earliest PartnerLabResult.test_date per participant ─
+        # ── Step 3: Earliest lab test_date and ODK created_at ─────────
+        # One UNION ALL round trip. Each branch fills its own typed column and
+        # leaves the other NULL, so the lab date stays a DATE and the ODK
+        # timestamp keeps its time zone. The lab branch is served by the
+        # partial index ix_plr_participant_dated (participant_id, test_date
+        # WHERE test_date IS NOT NULL), so each MIN is one index probe.
+        # Candidate ids travel as one uuid[] parameter (= ANY) rather than
+        # one bind per id in IN (...), whatever the participant count.
+        ids_param = bindparam(
+            "participant_ids", participant_ids, type_=ARRAY(UUID(as_uuid=True))
+        )
         lab_dates_q = (
             select(
                 PartnerLabResult.participant_id,
                 func.min(PartnerLabResult.test_date).label("earliest_test_date"),
+                null().cast(DateTime(timezone=True)).label("earliest_odk"),
             )
             .where(
-                PartnerLabResult.participant_id.in_(participant_ids),
+                PartnerLabResult.participant_id == any_(ids_param),
                 PartnerLabResult.test_date.isnot(None),
             )
             .group_by(PartnerLabResult.participant_id)
         )
-        lab_date_rows = (await db.execute(lab_dates_q)).all()
-        lab_dates: dict = {r[0]: r[1] for r in lab_date_rows}
-        logger.info("Lab result dates found for %d participants.", len(lab_dates))
-
-        # ── Step 4: Earliest OdkSubmission.created_at per participant ──
         odk_dates_q = (
             select(
                 OdkSubmission.participant_id,
+                null().cast(Date).label("earliest_test_date"),
                 func.min(OdkSubmission.created_at).label("earliest_odk"),
             )
             .where(
-                OdkSubmission.participant_id.in_(participant_ids),
+                OdkSubmission.participant_id == any_(ids_param),
                 OdkSubmission.participant_id.isnot(None),
             )
             .group_by(OdkSubmission.participant_id)
         )
-        odk_date_rows = (await db.execute(odk_dates_q)).all()
-        odk_dates: dict = {r[0]: r[1] for r in odk_date_rows}
+        lab_dates: dict = {}
+        odk_dates: dict = {}
+        for pid, earliest_test_date, earliest_odk in (
+            await db.execute(union_all(lab_dates_q, odk_dates_q))
+        ).all():
+            if earliest_test_date is not None:
+                lab_dates[pid] = earliest_test_date
+            else:
+                odk_dates[pid] = earliest_odk
+        logger.info("Lab result dates found for %d participants.", len(lab_dates))
         logger.info("ODK submission dates found for %d participants.", len(odk_dates))
 
-        # ── Step 5: Apply updates ─────────────────────────────────────
+        # ── Step 4: Apply updates ─────────────────────────────────────
         updated_sample = 0
         updated_odk = 0
         skipped = 0
+        # Collected here and written in bulk after the loop
+        date_updates: list[dict] = []
+        no_evidence_ids: list = []
+        # Many participants share a sample date; build each midnight once
+        utc_midnights: dict[date, datetime] = {}
+        # Per-participant report, emitted as one log record after the loop
+        report_lines: list[str] | None = [] if logger.isEnabledFor(logging.INFO) else None
 
-        for pid, pcode, current_dt in candidate_rows:
+        for pid, pcode, current_dt, current_source in candidate_rows:
             lab_date = lab_dates.get(pid)
             odk_date = odk_dates.get(pid)
 
             if lab_date is not None:
                 # Convert date → datetime (midnight UTC)
-                new_dt = datetime(
-                    lab_date.year, lab_date.month, lab_date.day,
-                    tzinfo=timezone.utc,
-                )
+                new_dt = utc_midnights.get(lab_date)
+                if new_dt is None:
+                    new_dt = utc_midnights[lab_date] = datetime(
+                        lab_date.year, lab_date.month, lab_date.day,
+                        tzinfo=timezone.utc,
+                    )
                 source = "backfill_lab_date"
                 updated_sample += 1
             elif odk_date is not None:
@@ -151,36 +193,40 @@ async def run_backfill(dry_run: bool = False) -> None:
                 source = "backfill_odk"
                 updated_odk += 1
             else:
-                # No better evidence; mark as bulk_import and move on
-                if not dry_run:
-                    await db.execute(
-                        update(Participant)
-                        .where(Participant.id == pid)
-                        .values(enrollment_date_source="bulk_import")
-                    )
+                # No better evidence; mark as bulk_import (unless it already
+                # is, which would be a no-op write) and move on
+                if current_source != "bulk_import":
+                    no_evidence_ids.append(pid)
                 skipped += 1
                 logger.debug("No evidence for %s — keeping bulk_import date.", pcode)
                 continue
 
-            logger.info(
-                "%-12s  %s -> %s  [%s]",
-                pcode,
-                current_dt.date() if current_dt else "None",
-                new_dt.date(),
-                source,
-            )
+            if report_lines is not None:
+                report_lines.append(
+                    f"{pcode:<12}  {current_dt.date() if current_dt else 'None'}"
+                    f" -> {new_dt.date()}  [{source}]"
+                )
+
+            date_updates.append({
+                "id": pid,
+                "enrollment_date": new_dt,
+                "enrollment_date_source": source,
+            })
 
-            if not dry_run:
+        if report_lines:
+            logger.info("Updates:\n%s", "\n".join(report_lines))
+
+        if not dry_run:
+            # ORM bulk UPDATE by primary key: one executemany for all dated
+            # participants, one IN-list UPDATE for the rest
+            if date_updates:
+                await db.execute(update(Participant), date_updates)
+            if no_evidence_ids:
                 await db.execute(
                     update(Participant)
-                    .where(Participant.id == pid)
-                    .values(
-                        enrollment_date=new_dt,
-                        enrollment_date_source=source,
-                    )
+                    .where(Participant.id.in_(no_evidence_ids))
+                    .values(enrollment_date_source="bulk_import")
                 )
-
-        if not dry_run:
             await db.commit()
             logger.info(
                 "Committed. Updated from sample_date: %d, odk_submission: %d, skipped: %d.",
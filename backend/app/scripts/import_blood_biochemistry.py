@@ -12,10 +12,11 @@ import csv
 import sys
 import uuid
 from datetime import date, datetime, timezone
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 from pathlib import Path
 
-from sqlalchemy import select
+from sqlalchemy import Numeric, case, cast, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import async_session_factory
 from app.models.enums import MatchStatus, PartnerName
@@ -29,7 +30,7 @@ from app.models.user import User
 
 # Map CSV column names to canonical test definitions
 # (csv_column, display_name, category, unit, ref_low, ref_high)
-TEST_DEFINITIONS: dict[str, tuple[str, str, str, str | None, str | None]] = {
+_TEST_DEFINITION_STRINGS: dict[str, tuple[str, str, str | None, str | None, str | None]] = {
     "Absolute_Basophil_Count": ("Absolute Basophil Count", "CBC - Differential", "10^3/uL", None, None),
     "Absolute_Eosinophil_Count": ("Absolute Eosinophil Count", "CBC - Differential", "10^3/uL", None, None),
     "Absolute_Lymphocyte_Count": ("Absolute Lymphocyte Count", "CBC - Differential", "10^3/uL", None, None),
@@ -113,27 +114,30 @@ TEST_DEFINITIONS: dict[str, tuple[str, str, str, str | None, str | None]] = {
     "WBC_Count": ("WBC Count", "Hematology", "thousand/uL", "4.0", "11.0"),
 }
 
+# Reference bounds parsed to Decimal once, at module load
+TEST_DEFINITIONS: dict[str, tuple[str, str, str | None, Decimal | None, Decimal | None]] = {
+    col: (display, category, unit,
+          Decimal(ref_low) if ref_low else None,
+          Decimal(ref_high) if ref_high else None)
+    for col, (display, category, unit, ref_low, ref_high) in _TEST_DEFINITION_STRINGS.items()
+}
+
 # Non-test columns to skip
 SKIP_COLUMNS = {"Participant_ID", "Provider", "Age", "urban/rural", "Sample_Date", "Sample_Month", "Sample_Year"}
 
+# Result rows buffered per provider before each COPY; bounds memory while
+# keeping the number of COPY round trips small
+IMPORT_BATCH_SIZE = 10_000
+
 PROVIDER_MAP = {
     "1MG": PartnerName.ONE_MG,
     "Healthians": PartnerName.HEALTHIANS,
 }
 
 
-def _to_decimal(val: str) -> Decimal | None:
-    if not val or val.strip() == "":
-        return None
-    try:
-        return Decimal(val.strip())
-    except InvalidOperation:
-        return None
-
-
-def _parse_date(row: dict) -> date | None:
-    """Try to parse sample date from the row. Returns a date object or None."""
-    d = row.get("Sample_Date", "").strip()
+def _parse_date(sample_date: str, month: str, year: str) -> date | None:
+    """Try to parse sample date from the row's cells. Returns a date object or None."""
+    d = sample_date.strip()
     if d:
         for fmt in ("%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d", "%-m/%-d/%Y"):
             try:
@@ -141,8 +145,8 @@ def _parse_date(row: dict) -> date | None:
             except ValueError:
                 continue
         return None
-    m = row.get("Sample_Month", "").strip()
-    y = row.get("Sample_Year", "").strip()
+    m = month.strip()
+    y = year.strip()
     if m and y:
         # Month/Year only — use 1st of month
         for fmt in ("%m/%Y", "%B/%Y", "%b/%Y"):
@@ -153,18 +157,46 @@ def _parse_date(row: dict) -> date | None:
     return None
 
 
+# Plain decimal numbers only; anything else (e.g. "<0.5", "Positive") is
+# stored as text and never flagged
+_NUMERIC_VALUE_RE = r"^[+-]?([0-9]+[.]?[0-9]*|[.][0-9]+)([eE][+-]?[0-9]+)?$"
+
+
+async def _flag_abnormal(session: AsyncSession, import_ids: list[uuid.UUID]) -> None:
+    """Set is_abnormal for the imported results in a single UPDATE.
+
+    Values are compared against the canonical test's reference range in
+    Postgres. The CASE keeps the numeric cast behind the regex guard, since
+    WHERE clauses are not evaluated in a guaranteed order.
+    """
+    num_val = case(
+        (
+            PartnerLabResult.test_value.regexp_match(_NUMERIC_VALUE_RE),
+            cast(PartnerLabResult.test_value, Numeric),
+        ),
+        else_=None,
+    )
+    await session.execute(
+        update(PartnerLabResult)
+        .where(
+            PartnerLabResult.canonical_test_id == CanonicalTest.id,
+            PartnerLabResult.import_id.in_(import_ids),
+            or_(
+                num_val < CanonicalTest.reference_range_low,
+                num_val > CanonicalTest.reference_range_high,
+            ),
+        )
+        .values(is_abnormal=True)
+        .execution_options(synchronize_session=False)
+    )
+
+
 async def import_csv(csv_path: str) -> None:
     path = Path(csv_path)
     if not path.exists():
         print(f"ERROR: File not found: {csv_path}")
         return
 
-    with open(path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
-    print(f"Read {len(rows)} rows from {path.name}")
-
     async with async_session_factory() as session:
         # Get admin user
         admin = (await session.execute(select(User).limit(1))).scalar_one()
@@ -192,8 +224,8 @@ async def import_csv(csv_path: str) -> None:
                     display_name=display,
                     category=category,
                     standard_unit=unit or "",
-                    reference_range_low=Decimal(ref_low) if ref_low else None,
-                    reference_range_high=Decimal(ref_high) if ref_high else None,
+                    reference_range_low=ref_low,
+                    reference_range_high=ref_high,
                 ))
                 test_map[col_name] = tid
                 new_count += 1
@@ -202,103 +234,153 @@ async def import_csv(csv_path: str) -> None:
             await session.flush()
             print(f"Created {new_count} new canonical tests")
 
-        # Load existing participants by code
-        part_result = await session.execute(
-            select(Participant.participant_code, Participant.id)
+        # Load existing participants by code; dict() consumes the (code, id)
+        # pairs directly instead of indexing each row in a comprehension
+        participant_map: dict[str, uuid.UUID] = dict(
+            (await session.execute(
+                select(Participant.participant_code, Participant.id)
+            )).tuples().all()
         )
-        participant_map: dict[str, uuid.UUID] = {
-            r[0]: r[1] for r in part_result.all()
-        }
         print(f"Found {len(participant_map)} existing participants in DB")
 
-        # Group rows by provider
-        by_provider: dict[str, list[dict]] = {}
-        for row in rows:
-            prov = row.get("Provider", "Unknown")
-            by_provider.setdefault(prov, []).append(row)
+        # Stream the CSV in one pass. Each provider gets its import record on
+        # first sight, and its result rows are written whenever the buffer
+        # fills, so neither the input rows nor the full result set is held.
+        imports: dict[str, uuid.UUID] = {}
+        pending: dict[str, list[dict]] = {}
+        participants: dict[str, int] = {}
+        matched_by_provider: dict[str, int] = {}
+        skipped: dict[str, int] = {}
+        rows_read = 0
 
         total_results = 0
         total_matched = 0
         total_unmatched = 0
 
-        for provider_name, provider_rows in by_provider.items():
-            partner = PROVIDER_MAP.get(provider_name)
-            if not partner:
-                print(f"  WARNING: Unknown provider '{provider_name}', skipping {len(provider_rows)} rows")
-                continue
-
-            # Create import record
-            import_id = uuid.uuid4()
-            matched = sum(1 for r in provider_rows if r["Participant_ID"] in participant_map)
-            session.add(PartnerLabImport(
-                id=import_id,
-                partner_name=partner,
-                import_date=datetime.now(timezone.utc),
-                source_file_name=path.name,
-                records_total=len(provider_rows),
-                records_matched=matched,
-                records_failed=len(provider_rows) - matched,
-                imported_by=admin.id,
-                notes=f"Blood biochemistry import from {provider_name}",
-            ))
-            await session.flush()
+        async def flush(provider_name: str) -> None:
+            nonlocal total_results
+            # Every batch, including each provider's short tail, is loaded
+            # with COPY: this script only ever writes new, flat result rows
+            buffer = pending[provider_name]
+            total_results += await PartnerLabResult.copy_create(
+                session, imports[provider_name], buffer
+            )
+            buffer.clear()
+
+        with open(path, encoding="utf-8") as f:
+            # Plain csv.reader with header positions resolved once: no dict
+            # per row, and cells are read by index
+            reader = csv.reader(f)
+            header = next(reader, [])
+            idx = {name: i for i, name in enumerate(header)}
+            width = len(header)
+
+            def cell(row: list[str], name: str, default: str = "") -> str:
+                i = idx.get(name)
+                return row[i] if i is not None else default
+
+            # Per-test lookups resolved once rather than for every cell; tests
+            # without a column in this file never produce results
+            tests_fast: list[tuple[int, str, uuid.UUID, str]] = [
+                (idx[col_name], col_name, test_map[col_name], unit or "")
+                for col_name, (_, _, unit, _, _) in TEST_DEFINITIONS.items()
+                if col_name in idx
+            ]
+
+            for row in reader:
+                if len(row) < width:
+                    # Short rows read as empty cells, as DictReader did
+                    row += [""] * (width - len(row))
+                rows_read += 1
+                provider_name = cell(row, "Provider", "Unknown")
+                partner = PROVIDER_MAP.get(provider_name)
+                if not partner:
+                    skipped[provider_name] = skipped.get(provider_name, 0) + 1
+                    continue
+
+                if provider_name not in imports:
+                    # Counts are filled in once the provider's rows are done
+                    import_id = uuid.uuid4()
+                    session.add(PartnerLabImport(
+                        id=import_id,
+                        partner_name=partner,
+                        import_date=datetime.now(timezone.utc),
+                        source_file_name=path.name,
+                        imported_by=admin.id,
+                        notes=f"Blood biochemistry import from {provider_name}",
+                    ))
+                    await session.flush()
+                    imports[provider_name] = import_id
+                    pending[provider_name] = []
+                    participants[provider_name] = 0
+                    matched_by_provider[provider_name] = 0
 
-            # Process each row
-            for row in provider_rows:
-                p_code = row["Participant_ID"].strip()
+                p_code = cell(row, "Participant_ID").strip()
                 p_id = participant_map.get(p_code)
                 match_status = MatchStatus.AUTO_MATCHED if p_id else MatchStatus.UNMATCHED
 
+                participants[provider_name] += 1
                 if p_id:
+                    matched_by_provider[provider_name] += 1
                     total_matched += 1
                 else:
                     total_unmatched += 1
 
-                sample_date = _parse_date(row)
-                age_at_test_str = row.get("Age", "").strip()
+                sample_date = _parse_date(
+                    cell(row, "Sample_Date"),
+                    cell(row, "Sample_Month"),
+                    cell(row, "Sample_Year"),
+                )
+                age_at_test_str = cell(row, "Age").strip()
                 age_at_test = int(age_at_test_str) if age_at_test_str.isdigit() else None
 
+                buffer = pending[provider_name]
                 # Create result for each non-empty test value
-                for col_name in TEST_DEFINITIONS:
-                    val = row.get(col_name, "").strip()
+                for col, col_name, test_id, unit in tests_fast:
+                    # Most cells are empty: skip them before any string work
+                    raw_val = row[col]
+                    if not raw_val:
+                        continue
+                    val = raw_val.strip()
                     if not val:
                         continue
 
-                    test_id = test_map.get(col_name)
-                    defn = TEST_DEFINITIONS[col_name]
-                    unit = defn[2] or ""
-                    ref_low = defn[3]
-                    ref_high = defn[4]
-
-                    # Check if abnormal
-                    is_abnormal = False
-                    num_val = _to_decimal(val)
-                    if num_val is not None:
-                        if ref_low and num_val < Decimal(ref_low):
-                            is_abnormal = True
-                        if ref_high and num_val > Decimal(ref_high):
-                            is_abnormal = True
-
                     raw = {}
                     if age_at_test is not None:
                         raw["age_at_test"] = age_at_test
-                    session.add(PartnerLabResult(
-                        id=uuid.uuid4(),
-                        import_id=import_id,
-                        participant_id=p_id,
-                        participant_code_raw=p_code,
-                        test_date=sample_date,
-                        test_name_raw=col_name,
-                        canonical_test_id=test_id,
-                        test_value=val,
-                        test_unit=unit,
-                        is_abnormal=is_abnormal,
-                        match_status=match_status,
-                        raw_data=raw if raw else None,
-                    ))
-                    total_results += 1
-
-            print(f"  {provider_name}: {len(provider_rows)} participants, {matched} matched")
+                    buffer.append({
+                        "participant_id": p_id,
+                        "participant_code_raw": p_code,
+                        "test_date": sample_date,
+                        "test_name_raw": col_name,
+                        "canonical_test_id": test_id,
+                        "test_value": val,
+                        "test_unit": unit,
+                        # Flagged in one UPDATE once all rows are written
+                        "is_abnormal": False,
+                        "match_status": match_status,
+                        "raw_data": raw if raw else None,
+                    })
+
+                if len(buffer) >= IMPORT_BATCH_SIZE:
+                    await flush(provider_name)
+
+        print(f"Read {rows_read} rows from {path.name}")
+        for provider_name, count in skipped.items():
+            print(f"  WARNING: Unknown provider '{provider_name}', skipped {count} rows")
+
+        for provider_name, import_id in imports.items():
+            await flush(provider_name)
+            total = participants[provider_name]
+            matched = matched_by_provider[provider_name]
+            record = await session.get(PartnerLabImport, import_id)
+            record.records_total = total
+            record.records_matched = matched
+            record.records_failed = total - matched
+            print(f"  {provider_name}: {total} participants, {matched} matched")
+
+        if imports:
+            await _flag_abnormal(session, list(imports.values()))
 
         await session.commit()
 
@@ -9,7 +9,7 @@ Seeds ONLY reference data needed to start the application:
 All operational data (participants, samples, storage, etc.) is created
 through the application UI during normal operations.
 
-Idempotent: checks for existing data before inserting.
+Idempotent: rows that already exist are skipped (INSERT ... ON CONFLICT DO NOTHING).
 Run via: python -m app.seed
 """
 
@@ -18,10 +18,11 @@ import uuid
 from datetime import timedelta, timezone
 from decimal import Decimal
 
-import bcrypt
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.security import hash_password
 from app.database import async_session_factory
 from app.models.enums import SettingValueType
 from app.models.participant import CollectionSite
@@ -38,36 +39,45 @@ from app.models.user import User
 IST = timezone(timedelta(hours=5, minutes=30))
 
 
-def _hash(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=12)).decode()
-
-
 # ---------------------------------------------------------------------------
 # 1. Admin User
 # ---------------------------------------------------------------------------
 
+ADMIN_EMAIL = "amruthbhat@iisc.ac.in"
+
+
+async def _admin_id(session: AsyncSession) -> uuid.UUID | None:
+    return await session.scalar(select(User.id).where(User.email == ADMIN_EMAIL))
+
+
 async def seed_admin(session: AsyncSession) -> uuid.UUID:
     """Create the admin user. Returns admin user ID."""
-    result = await session.execute(
-        select(User).where(User.email == "amruthbhat@iisc.ac.in")
-    )
-    existing = result.scalar_one_or_none()
-    if existing is not None:
+    # Looked up first so an existing install does not pay for the hash
+    existing_id = await _admin_id(session)
+    if existing_id is not None:
         print("[admin] Already exists, skipping.")
-        return existing.id
-
-    uid = uuid.uuid4()
-    session.add(
-        User(
-            id=uid,
-            email="amruthbhat@iisc.ac.in",
-            password_hash=_hash("Admin@123"),
+        return existing_id
+
+    # bcrypt is deliberately slow; hash in a worker thread instead of
+    # blocking the event loop
+    password_hash = await asyncio.to_thread(hash_password, "Admin@123")
+    uid = await session.scalar(
+        pg_insert(User)
+        .values(
+            id=uuid.uuid4(),
+            email=ADMIN_EMAIL,
+            password_hash=password_hash,
             full_name="Amruth Bhat",
             role="super_admin",
             is_active=True,
         )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User.id)
     )
-    await session.flush()
+    if uid is None:
+        # A concurrent seed created it between the lookup and the insert
+        print("[admin] Already exists, skipping.")
+        return await _admin_id(session)
     print("  [admin] Created amruthbhat@iisc.ac.in (super_admin)")
     return uid
 
@@ -76,7 +86,7 @@ async def seed_admin(session: AsyncSession) -> uuid.UUID:
 # 2. System Settings
 # ---------------------------------------------------------------------------
 
-DEFAULT_SETTINGS = [
+DEFAULT_SETTINGS = (
     ("session", "timeout_minutes", "30", SettingValueType.INTEGER, "Session inactivity timeout in minutes"),
     ("session", "max_concurrent", "3", SettingValueType.INTEGER, "Maximum concurrent sessions per user"),
     ("odk", "sync_interval_minutes", "60", SettingValueType.INTEGER, "ODK sync interval in minutes"),
@@ -109,20 +119,26 @@ DEFAULT_SETTINGS = [
         SettingValueType.JSON,
         "Participant code format: {age_group}{sex}-{number} e.g. 1A-001",
     ),
-]
+)
 
 
 async def seed_settings(session: AsyncSession) -> None:
-    result = await session.execute(select(SystemSetting).limit(1))
-    if result.scalar_one_or_none() is not None:
+    # ORM bulk INSERT: one multi-row VALUES statement. Settings that already
+    # exist (including ones changed by an admin) are left alone.
+    inserted = (await session.scalars(
+        pg_insert(SystemSetting)
+        .on_conflict_do_nothing(index_elements=["category", "key"])
+        .returning(SystemSetting.id),
+        [
+            {"id": uuid.uuid4(), "category": cat, "key": key, "value": val,
+             "value_type": vt, "description": desc}
+            for cat, key, val, vt, desc in DEFAULT_SETTINGS
+        ],
+    )).all()
+    if not inserted:
         print("[settings] Already seeded, skipping.")
         return
-    for cat, key, val, vt, desc in DEFAULT_SETTINGS:
-        session.add(
-            SystemSetting(id=uuid.uuid4(), category=cat, key=key, value=val, value_type=vt, description=desc)
-        )
-    print(f"  [settings] Seeded {len(DEFAULT_SETTINGS)} system settings.")
-    await session.flush()
+    print(f"  [settings] Seeded {len(inserted)} system settings.")
 
 
 # ---------------------------------------------------------------------------
@@ -137,7 +153,7 @@ async def seed_settings(session: AsyncSession) -> None:
 # Sites do not have formal site codes in the study protocol.
 # Short codes below are for internal LIIMS use only.
 
-SITES = [
+SITES = (
     # (name, code, city, address, is_active, range_start, range_end)
     (
         "M.S. Ramaiah Memorial Hospital",
@@ -181,41 +197,44 @@ SITES = [
         "Mahatma Gandhi Road, Mysuru, Karnataka 570004",
         False, 50000, 59999,  # not active yet
     ),
-]
+)
 
 
 async def seed_sites(session: AsyncSession, admin_id: uuid.UUID) -> None:
-    result = await session.execute(
-        select(CollectionSite).where(CollectionSite.code == SITES[0][1])
-    )
-    if result.scalar_one_or_none() is not None:
+    created = set((await session.scalars(
+        pg_insert(CollectionSite)
+        .on_conflict_do_nothing(index_elements=["code"])
+        .returning(CollectionSite.code),
+        [
+            {
+                "id": uuid.uuid4(),
+                "name": name,
+                "code": code,
+                "participant_range_start": rstart,
+                "participant_range_end": rend,
+                "city": city,
+                "address": addr,
+                "is_active": is_active,
+                "created_by": admin_id,
+            }
+            for name, code, city, addr, is_active, rstart, rend in SITES
+        ],
+    )).all())
+    if not created:
         print("[sites] Already seeded, skipping.")
         return
-
-    for name, code, city, addr, is_active, rstart, rend in SITES:
-        session.add(
-            CollectionSite(
-                id=uuid.uuid4(),
-                name=name,
-                code=code,
-                participant_range_start=rstart,
-                participant_range_end=rend,
-                city=city,
-                address=addr,
-                is_active=is_active,
-                created_by=admin_id,
-            )
-        )
+    for name, code, _, _, is_active, _, _ in SITES:
+        if code not in created:
+            continue
         status = "active" if is_active else "inactive"
         print(f"  [sites] Created {code}: {name} ({status})")
-    await session.flush()
 
 
 # ---------------------------------------------------------------------------
 # 4. Canonical Lab Tests (real reference ranges for partner lab imports)
 # ---------------------------------------------------------------------------
 
-CANONICAL_TESTS = [
+CANONICAL_TESTS = (
     ("hemoglobin", "Hemoglobin", "Hematology", "g/dL", Decimal("12.0"), Decimal("17.0")),
     ("rbc_count", "RBC Count", "Hematology", "million/uL", Decimal("4.0"), Decimal("5.5")),
     ("wbc_count", "WBC Count", "Hematology", "thousand/uL", Decimal("4.0"), Decimal("11.0")),
@@ -231,73 +250,84 @@ CANONICAL_TESTS = [
     ("tsh", "TSH", "Thyroid", "mIU/L", Decimal("0.4"), Decimal("4.0")),
     ("vitamin_d", "Vitamin D (25-OH)", "Vitamins", "ng/mL", Decimal("30"), Decimal("100")),
     ("vitamin_b12", "Vitamin B12", "Vitamins", "pg/mL", Decimal("200"), Decimal("900")),
-]
+)
+
+
+# Seed aliases share the partner's unit, so every row uses the same factor
+_UNIT_FACTOR = Decimal("1.0")
 
 
 async def seed_canonical_tests(session: AsyncSession) -> None:
-    result = await session.execute(select(CanonicalTest).limit(1))
-    if result.scalar_one_or_none() is not None:
+    # Tests that already exist keep their id; only new ones get aliases
+    created = (await session.execute(
+        pg_insert(CanonicalTest)
+        .on_conflict_do_nothing(index_elements=["canonical_name"])
+        .returning(CanonicalTest.id, CanonicalTest.display_name, CanonicalTest.standard_unit),
+        [
+            {
+                "id": uuid.uuid4(),
+                "canonical_name": cname,
+                "display_name": dname,
+                "category": cat,
+                "standard_unit": unit,
+                "reference_range_low": low,
+                "reference_range_high": high,
+            }
+            for cname, dname, cat, unit, low, high in CANONICAL_TESTS
+        ],
+    )).all()
+    if not created:
         print("[canonical_tests] Already seeded, skipping.")
         return
 
-    for cname, dname, cat, unit, low, high in CANONICAL_TESTS:
-        tid = uuid.uuid4()
-        session.add(
-            CanonicalTest(
-                id=tid,
-                canonical_name=cname,
-                display_name=dname,
-                category=cat,
-                standard_unit=unit,
-                reference_range_low=low,
-                reference_range_high=high,
-            )
-        )
-        # Add aliases for partner labs
-        for partner in [PartnerName.HEALTHIANS, PartnerName.LALPATH]:
-            session.add(
-                TestNameAlias(
-                    id=uuid.uuid4(),
-                    canonical_test_id=tid,
-                    partner_name=partner,
-                    alias_name=dname.upper(),
-                    alias_unit=unit,
-                    unit_conversion_factor=Decimal("1.0"),
-                )
-            )
-
-    await session.flush()
-    print(f"  [canonical_tests] Seeded {len(CANONICAL_TESTS)} tests with partner aliases.")
+    # Add aliases for partner labs
+    aliases = [
+        {
+            "canonical_test_id": tid,
+            "partner_name": partner,
+            "alias_name": dname.upper(),
+            "alias_unit": unit,
+            "unit_conversion_factor": _UNIT_FACTOR,
+        }
+        for tid, dname, unit in created
+        for partner in (PartnerName.HEALTHIANS, PartnerName.LALPATH)
+    ]
+    await TestNameAlias.upsert_many(session, aliases)
+    print(f"  [canonical_tests] Seeded {len(created)} tests with partner aliases.")
 
 
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
 
+async def _seed_in_own_session(step, *args) -> None:
+    """Run one seed step in its own session and transaction."""
+    async with async_session_factory() as session:
+        await step(session, *args)
+        await session.commit()
+
+
 async def run_seed() -> None:
     print("=" * 60)
     print("LIIMS Database Seeder - Longevity India (BHARAT) Study")
     print("=" * 60)
 
+    # 1. Admin user, committed first: collection sites reference it
+    print("\n[1/4] Seeding admin user...")
     async with async_session_factory() as session:
-        # 1. Admin user
-        print("\n[1/4] Seeding admin user...")
         admin_id = await seed_admin(session)
-
-        # 2. System settings
-        print("\n[2/4] Seeding system settings...")
-        await seed_settings(session)
-
-        # 3. Collection sites
-        print("\n[3/4] Seeding collection sites...")
-        await seed_sites(session, admin_id)
-
-        # 4. Canonical lab tests
-        print("\n[4/4] Seeding canonical lab tests...")
-        await seed_canonical_tests(session)
-
         await session.commit()
 
+    # 2-4. System settings, collection sites and canonical lab tests are
+    # independent, so each runs on its own pooled connection. Every step is
+    # idempotent, so a partial failure is fixed by re-running the seed.
+    print("\n[2-4/4] Seeding system settings, collection sites and canonical lab tests...")
+    await asyncio.gather(
+        _seed_in_own_session(seed_settings),
+        _seed_in_own_session(seed_sites, admin_id),
+        _seed_in_own_session(seed_canonical_tests),
+    )
+
     print("\n" + "=" * 60)
     print("Seed complete!")
     print("=" * 60)
@@ -116,6 +116,7 @@ class AuthService:
             select(UserSession).where(
                 UserSession.user_id == user_id,
                 UserSession.token_hash == token_h,
+                UserSession.revoked_at.is_(None),
             )
         )
         session = result.scalar_one_or_none()
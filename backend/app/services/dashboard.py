@@ -19,7 +19,7 @@ from app.models.omics import IccProcessing, OmicsResult, OmicsResultSet
 from app.models.participant import CollectionSite, Participant
 from app.models.partner import CanonicalTest, PartnerLabImport, PartnerLabResult
 from app.models.sample import Sample
-from app.models.storage import Freezer, StorageBox, StoragePosition, StorageRack
+from app.models.storage import Freezer
 
 logger = logging.getLogger(__name__)
 
@@ -243,21 +243,16 @@ class DashboardService:
                 pass
 
         # Continuous age distribution from clinical_data
-        age_values = []
+        age_expr = Participant.clinical_numeric("demographics", "age")
         age_q = await self.db.execute(
-            select(Participant.clinical_data["demographics"]["age"].as_string())
+            select(age_expr)
             .where(
                 *base_where,
-                Participant.clinical_data.isnot(None),
+                age_expr > 0,
+                age_expr < 120,
             )
         )
-        for row in age_q.scalars().all():
-            try:
-                age = float(row)
-                if 0 < age < 120:
-                    age_values.append(age)
-            except (ValueError, TypeError):
-                pass
+        age_values = [float(age) for age in age_q.scalars().all()]
 
         return {
             "total_participants": total,
@@ -324,28 +319,22 @@ class DashboardService:
             for r in by_status_rows
         ]
 
-        # Storage utilization: total positions vs occupied
-        total_positions_q = select(func.count(StoragePosition.id))
-        total_positions = (await self.db.execute(total_positions_q)).scalar_one()
-
-        occupied_q = select(func.count()).where(
-            StoragePosition.sample_id.isnot(None)
-        )
-        occupied = (await self.db.execute(occupied_q)).scalar_one()
+        # Storage utilization: total positions vs occupied (trigger-maintained
+        # freezer counters)
+        total_positions, occupied = await self._position_totals()
 
         # Per-freezer utilization
         freezer_util_q = (
             select(
                 Freezer.name,
                 Freezer.freezer_type,
-                func.count(StoragePosition.id).label("total_positions"),
-                func.count(StoragePosition.sample_id).label("occupied"),
+                Freezer.total_positions,
+                Freezer.occupied_positions,
+            )
+            .where(
+                Freezer.is_deleted == False,  # noqa: E712
+                Freezer.total_positions > 0,
             )
-            .join(StorageRack, StorageRack.freezer_id == Freezer.id)
-            .join(StorageBox, StorageBox.rack_id == StorageRack.id)
-            .join(StoragePosition, StoragePosition.box_id == StorageBox.id)
-            .where(Freezer.is_deleted == False)  # noqa: E712
-            .group_by(Freezer.name, Freezer.freezer_type)
             .order_by(Freezer.name.asc())
         )
         freezer_rows = (await self.db.execute(freezer_util_q)).all()
@@ -689,13 +678,7 @@ class DashboardService:
         stored = (await self.db.execute(stored_q)).scalar_one()
 
         # ── Storage utilization ───────────────────────────────────────
-        total_positions_q = select(func.count(StoragePosition.id))
-        total_positions = (await self.db.execute(total_positions_q)).scalar_one()
-
-        occupied_q = select(func.count()).where(
-            StoragePosition.sample_id.isnot(None)
-        )
-        occupied = (await self.db.execute(occupied_q)).scalar_one()
+        total_positions, occupied = await self._position_totals()
 
         utilization_pct = (
             round(occupied / total_positions * 100, 1)
@@ -880,3 +863,17 @@ class DashboardService:
                 "grand": {"count": grand_count, "target": grand_target},
             },
         }
+
+    # ── Private helpers ───────────────────────────────────────────────
+
+    async def _position_totals(self) -> tuple[int, int]:
+        """Return (total, occupied) storage positions across all freezers."""
+        row = (
+            await self.db.execute(
+                select(
+                    func.coalesce(func.sum(Freezer.total_positions), 0),
+                    func.coalesce(func.sum(Freezer.occupied_positions), 0),
+                )
+            )
+        ).one()
+        return int(row[0]), int(row[1])
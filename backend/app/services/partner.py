@@ -8,9 +8,10 @@ import tempfile
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import func, select, text
+from sqlalchemy import String, bindparam, func, select, text, true
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer_group
 
 from app.models.enums import (
     AgeGroup,
@@ -421,6 +422,20 @@ class OdkService:
 
             processed = 0
             failed = 0
+            submission_rows: list[dict] = []
+
+            # Pre-load already imported instance IDs in chunks instead of
+            # one duplicate-check query per submission
+            instance_ids = [s.get("__id", "") for s in submissions if s.get("__id")]
+            seen_instance_ids: set[str] = set()
+            for batch_start in range(0, len(instance_ids), 1000):
+                batch = instance_ids[batch_start:batch_start + 1000]
+                dup_result = await self.db.execute(
+                    select(OdkSubmission.odk_instance_id).where(
+                        OdkSubmission.odk_instance_id.in_(batch)
+                    )
+                )
+                seen_instance_ids.update(dup_result.scalars().all())
 
             for submission in submissions:
                 try:
@@ -429,27 +444,25 @@ class OdkService:
                         failed += 1
                         continue
 
-                    # Check for duplicate
-                    dup = await self.db.execute(
-                        select(OdkSubmission.id).where(
-                            OdkSubmission.odk_instance_id == instance_id
-                        )
-                    )
-                    if dup.scalar_one_or_none() is not None:
+                    if instance_id in seen_instance_ids:
                         continue  # Already imported, skip silently
+                    seen_instance_ids.add(instance_id)
+
+                    form_version = submission.get("__system", {}).get("formVersion")
+                    # Strip PII before storing raw submission
+                    cleaned_submission = _strip_sensitive_fields(submission)
 
                     # Parse participant data
                     p_data = _parse_participant_from_odk(submission)
                     if not p_data:
-                        self.db.add(OdkSubmission(
-                            id=uuid.uuid4(),
-                            odk_instance_id=instance_id,
-                            odk_form_id=odk_form_id,
-                            odk_form_version=submission.get("__system", {}).get("formVersion"),
-                            submission_data=cleaned_submission,
-                            processing_status=OdkProcessingStatus.FAILED,
-                            error_message="Could not parse participant code",
-                        ))
+                        submission_rows.append({
+                            "odk_instance_id": instance_id,
+                            "odk_form_id": odk_form_id,
+                            "odk_form_version": form_version,
+                            "submission_data": cleaned_submission,
+                            "processing_status": OdkProcessingStatus.FAILED,
+                            "error_message": "Could not parse participant code",
+                        })
                         failed += 1
                         continue
 
@@ -457,17 +470,15 @@ class OdkService:
                     site_code = _get_site_code_for_number(p_data["participant_number"])
                     site = all_sites.get(site_code) if site_code else None
                     if site is None:
-                        cleaned_submission = _strip_sensitive_fields(submission)
-                        self.db.add(OdkSubmission(
-                            id=uuid.uuid4(),
-                            odk_instance_id=instance_id,
-                            odk_form_id=odk_form_id,
-                            odk_form_version=submission.get("__system", {}).get("formVersion"),
-                            participant_code_raw=p_data["participant_code"],
-                            submission_data=cleaned_submission,
-                            processing_status=OdkProcessingStatus.FAILED,
-                            error_message=f"Participant number {p_data['participant_number']} does not match any site range",
-                        ))
+                        submission_rows.append({
+                            "odk_instance_id": instance_id,
+                            "odk_form_id": odk_form_id,
+                            "odk_form_version": form_version,
+                            "participant_code_raw": p_data["participant_code"],
+                            "submission_data": cleaned_submission,
+                            "processing_status": OdkProcessingStatus.FAILED,
+                            "error_message": f"Participant number {p_data['participant_number']} does not match any site range",
+                        })
                         failed += 1
                         continue
 
@@ -480,8 +491,6 @@ class OdkService:
                     participant = existing.scalar_one_or_none()
 
                     clinical = _extract_clinical_data(submission)
-                    # Strip PII before storing raw submission
-                    cleaned_submission = _strip_sensitive_fields(submission)
 
                     if participant is None:
                         # Create new participant
@@ -510,23 +519,24 @@ class OdkService:
                         participant.collection_site_id = site.id
 
                     # Store submission record (PII stripped)
-                    self.db.add(OdkSubmission(
-                        id=uuid.uuid4(),
-                        odk_instance_id=instance_id,
-                        odk_form_id=odk_form_id,
-                        odk_form_version=submission.get("__system", {}).get("formVersion"),
-                        participant_id=participant.id,
-                        participant_code_raw=p_data["participant_code"],
-                        submission_data=cleaned_submission,
-                        processed_at=datetime.now(timezone.utc),
-                        processing_status=OdkProcessingStatus.PROCESSED,
-                    ))
+                    submission_rows.append({
+                        "odk_instance_id": instance_id,
+                        "odk_form_id": odk_form_id,
+                        "odk_form_version": form_version,
+                        "participant_id": participant.id,
+                        "participant_code_raw": p_data["participant_code"],
+                        "submission_data": cleaned_submission,
+                        "processed_at": datetime.now(timezone.utc),
+                        "processing_status": OdkProcessingStatus.PROCESSED,
+                    })
                     processed += 1
 
                 except Exception as e:
                     logger.error("Failed to process submission %s: %s", instance_id, e)
                     failed += 1
 
+            await OdkSubmission.bulk_upsert(self.db, submission_rows)
+
             log.submissions_processed = processed
             log.submissions_failed = failed
             log.status = OdkSyncStatus.COMPLETED
@@ -583,6 +593,14 @@ class OdkService:
         result = await self.db.execute(query)
         return list(result.scalars().all()), total
 
+    async def get_submission(self, submission_id: uuid.UUID) -> OdkSubmission | None:
+        result = await self.db.execute(
+            select(OdkSubmission)
+            .options(undefer_group("payload"))
+            .where(OdkSubmission.id == submission_id)
+        )
+        return result.scalar_one_or_none()
+
 
 # ---------------------------------------------------------------------------
 # Canonical Test Service
@@ -804,6 +822,46 @@ class PartnerImportService:
         ))
         return record
 
+    async def _match_participant_codes(
+        self, codes: set[str]
+    ) -> dict[str, uuid.UUID]:
+        """Fuzzy-match raw participant codes to participants with pg_trgm.
+
+        Codes are sent as one array parameter per batch of 500; each picks its
+        most similar participant in a LATERAL subquery, so a whole batch costs
+        one round trip. Codes with no match above the threshold are omitted.
+        """
+        matches: dict[str, uuid.UUID] = {}
+        if not codes:
+            return matches
+
+        # The % operator (unlike a similarity() comparison) can use
+        # ix_participant_code_trgm; its cut-off is this GUC
+        await self.db.execute(text("SET LOCAL pg_trgm.similarity_threshold = 0.6"))
+        code_list = sorted(codes)
+        for batch_start in range(0, len(code_list), 500):
+            batch = code_list[batch_start:batch_start + 500]
+            raw = (
+                func.unnest(bindparam("codes", batch, type_=ARRAY(String)))
+                .table_valued("code")
+                .render_derived()
+            )
+            best = (
+                select(Participant.id)
+                .where(
+                    Participant.is_deleted == False,  # noqa: E712
+                    Participant.participant_code.op("%")(raw.c.code),
+                )
+                .order_by(func.similarity(Participant.participant_code, raw.c.code).desc())
+                .limit(1)
+                .lateral()
+            )
+            result = await self.db.execute(
+                select(raw.c.code, best.c.id).join(best, true())
+            )
+            matches.update({code: pid for code, pid in result.all()})
+        return matches
+
     async def preview_import(
         self, import_id: uuid.UUID
     ) -> ImportPreviewResponse:
@@ -842,23 +900,7 @@ class PartnerImportService:
             if code:
                 unique_codes.add(code)
 
-        # Single batch query for all unique participant codes using pg_trgm
-        code_to_participant: dict[str, uuid.UUID] = {}
-        if unique_codes:
-            for code in unique_codes:
-                p_result = await self.db.execute(
-                    select(Participant.id, Participant.participant_code)
-                    .where(
-                        Participant.is_deleted == False,  # noqa: E712
-                        text("similarity(participant.participant_code, :code) > 0.6"),
-                    )
-                    .params(code=code)
-                    .order_by(text("similarity(participant.participant_code, :code) DESC"))
-                    .limit(1)
-                )
-                row_result = p_result.one_or_none()
-                if row_result:
-                    code_to_participant[code] = row_result[0]
+        code_to_participant = await self._match_participant_codes(unique_codes)
 
         for idx, row in enumerate(preview_slice):
             participant_code_raw = row.get("participant_code", row.get("participant_id", "")).strip()
@@ -965,6 +1007,7 @@ class PartnerImportService:
         records_matched = 0
         records_failed = 0
         records_total = len(rows)
+        result_rows: list[dict] = []
 
         # Batch: collect unique participant codes and pre-match them all
         unique_codes: set[str] = set()
@@ -973,25 +1016,7 @@ class PartnerImportService:
             if code:
                 unique_codes.add(code)
 
-        code_to_participant: dict[str, uuid.UUID] = {}
-        # Process in batches of 500 to avoid overwhelming the DB
-        code_list = list(unique_codes)
-        for batch_start in range(0, len(code_list), 500):
-            batch = code_list[batch_start:batch_start + 500]
-            for code in batch:
-                p_result = await self.db.execute(
-                    select(Participant.id)
-                    .where(
-                        Participant.is_deleted == False,  # noqa: E712
-                        text("similarity(participant.participant_code, :code) > 0.6"),
-                    )
-                    .params(code=code)
-                    .order_by(text("similarity(participant.participant_code, :code) DESC"))
-                    .limit(1)
-                )
-                pid = p_result.scalar_one_or_none()
-                if pid:
-                    code_to_participant[code] = pid
+        code_to_participant = await self._match_participant_codes(unique_codes)
 
         for row in rows:
             participant_code_raw = row.get("participant_code", row.get("participant_id", "")).strip()
@@ -1016,20 +1041,22 @@ class PartnerImportService:
             else:
                 records_failed += 1
 
-            lab_result = PartnerLabResult(
-                id=uuid.uuid4(),
-                import_id=import_id,
-                participant_id=matched_participant_id,
-                participant_code_raw=participant_code_raw,
-                test_name_raw=test_name_raw,
-                canonical_test_id=canonical_test_id,
-                test_value=test_value,
-                test_unit=test_unit,
-                reference_range=reference_range,
-                raw_data=row,
-                match_status=match_status,
-            )
-            self.db.add(lab_result)
+            result_rows.append({
+                "participant_id": matched_participant_id,
+                "participant_code_raw": participant_code_raw,
+                "test_name_raw": test_name_raw,
+                "canonical_test_id": canonical_test_id,
+                "test_value": test_value,
+                "test_unit": test_unit,
+                "reference_range": reference_range,
+                "raw_data": row,
+                "match_status": match_status,
+            })
+
+        if len(result_rows) > PartnerLabResult.COPY_THRESHOLD:
+            await PartnerLabResult.copy_create(self.db, import_id, result_rows)
+        else:
+            await PartnerLabResult.bulk_create(self.db, import_id, result_rows)
 
         record.records_total = records_total
         record.records_matched = records_matched
@@ -1072,7 +1099,9 @@ class PartnerImportService:
     ) -> PartnerLabImport | None:
         result = await self.db.execute(
             select(PartnerLabImport)
-            .options(selectinload(PartnerLabImport.results))
+            .options(
+                selectinload(PartnerLabImport.results).undefer_group("payload")
+            )
             .where(PartnerLabImport.id == import_id)
         )
         return result.scalar_one_or_none()
@@ -6,9 +6,10 @@ import logging
 import uuid
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import false, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.base import SmallIntEnum
 from app.models.field_ops import FieldEvent
 from app.models.instrument import InstrumentRun
 from app.models.participant import Participant
@@ -248,6 +249,12 @@ class QueryBuilderService:
 
     def _apply_filter(self, query, col, operator: str, value):
         """Apply a single filter operator to a query."""
+        if isinstance(col.type, SmallIntEnum):
+            return self._apply_enum_code_filter(query, col, operator, value)
+        return self._apply_filter_plain(query, col, operator, value)
+
+    def _apply_filter_plain(self, query, col, operator: str, value):
+        """Apply an operator to a column whose binds take the value as-is."""
         if operator == "eq":
             return query.where(col == value)
         elif operator == "ne":
@@ -281,3 +288,36 @@ class QueryBuilderService:
                 return query.where(col.isnot(None))
         else:
             raise ValueError(f"Unsupported operator: {operator}")
+
+    def _apply_enum_code_filter(self, query, col, operator: str, value):
+        """Filter a SMALLINT-coded status column.
+
+        The column holds codes, not text, so text operators are matched
+        against the enum values in Python and applied as an IN over the
+        matching members. Every other value is checked against the enum so
+        an unknown status is a ValueError (400) rather than a bind failure.
+        """
+        enum_class = col.type.enum_class
+        if operator in ("like", "contains", "starts_with"):
+            needle = str(value).lower()
+            if operator == "starts_with":
+                matches = [m for m in enum_class if m.value.lower().startswith(needle)]
+            else:
+                matches = [m for m in enum_class if needle in m.value.lower()]
+            if not matches:
+                return query.where(false())
+            return query.where(col.in_(matches))
+        if operator == "is_null":
+            return self._apply_filter_plain(query, col, operator, value)
+
+        def member(v):
+            try:
+                return enum_class(v)
+            except ValueError:
+                raise ValueError(f"Invalid value for {col.key}: {v!r}") from None
+
+        if operator in ("in", "between"):
+            if not isinstance(value, list):
+                return self._apply_filter_plain(query, col, operator, value)
+            return self._apply_filter_plain(query, col, operator, [member(v) for v in value])
+        return self._apply_filter_plain(query, col, operator, member(value))
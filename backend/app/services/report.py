@@ -4,7 +4,6 @@ import logging
 import pathlib
 import uuid
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
 
 from jinja2 import Environment, FileSystemLoader
 from sqlalchemy import func, select
@@ -266,14 +265,15 @@ class ReportService:
             )
             .where(
                 *sample_where,
-                Sample.remaining_volume_ul.isnot(None),
-                Sample.initial_volume_ul.isnot(None),
-                Sample.initial_volume_ul > 0,
-                Sample.remaining_volume_ul < Sample.initial_volume_ul * Decimal("0.2"),
+                Sample.remaining_volume_centi_ul.isnot(None),
+                Sample.initial_volume_centi_ul.isnot(None),
+                Sample.initial_volume_centi_ul > 0,
+                # remaining < 20% of initial, kept in integer arithmetic
+                Sample.remaining_volume_centi_ul * 5 < Sample.initial_volume_centi_ul,
                 Sample.status != SampleStatus.DEPLETED,
                 Sample.status != SampleStatus.DISCARDED,
             )
-            .order_by(Sample.remaining_volume_ul.asc())
+            .order_by(Sample.remaining_volume_centi_ul.asc())
             .limit(50)
         )
         low_vol_rows = (await self.db.execute(low_vol_q)).all()
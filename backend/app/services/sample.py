@@ -202,7 +202,7 @@ class SampleService:
             select(Sample)
             .options(
                 selectinload(Sample.status_history),
-                selectinload(Sample.aliquots),
+                selectinload(Sample.aliquots.and_(Sample.is_deleted == False)),  # noqa: E712
             )
             .where(
                 Sample.id == sample_id,
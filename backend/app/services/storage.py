@@ -4,7 +4,7 @@ import logging
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import func, select
+from sqlalchemy import Text, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -421,11 +421,17 @@ class StorageService:
 
     async def _auto_create_positions(self, box: StorageBox) -> None:
         """Create NxM position grid for a box."""
+        rack_result = await self.db.execute(
+            select(StorageRack.freezer_id).where(StorageRack.id == box.rack_id)
+        )
+        freezer_id = rack_result.scalar_one()
         for r in range(1, box.rows + 1):
             for c in range(1, box.columns + 1):
                 self.db.add(StoragePosition(
                     id=uuid.uuid4(),
                     box_id=box.id,
+                    rack_id=box.rack_id,
+                    freezer_id=freezer_id,
                     row=r,
                     column=c,
                 ))
@@ -855,7 +861,7 @@ class StorageService:
             .join(StorageRack, StorageBox.rack_id == StorageRack.id)
             .join(Freezer, StorageRack.freezer_id == Freezer.id)
             .where(
-                Sample.sample_code.ilike(f"%{safe_code}%"),
+                cast(Sample.sample_code, Text).ilike(f"%{safe_code}%"),
                 Sample.is_deleted == False,  # noqa: E712
             )
             .limit(100)
@@ -882,30 +888,15 @@ class StorageService:
 
     async def _freezer_utilization(self, freezer_id: uuid.UUID) -> dict:
         """Compute used_positions, total_positions, utilization_pct for a freezer."""
-        # Total positions across all racks -> boxes -> positions
-        rack_ids_q = select(StorageRack.id).where(
-            StorageRack.freezer_id == freezer_id,
-            StorageRack.is_deleted == False,  # noqa: E712
-        )
-        box_ids_q = select(StorageBox.id).where(
-            StorageBox.rack_id.in_(rack_ids_q),
-            StorageBox.is_deleted == False,  # noqa: E712
-        )
-
-        total_result = await self.db.execute(
-            select(func.count(StoragePosition.id)).where(
-                StoragePosition.box_id.in_(box_ids_q)
-            )
-        )
-        total_positions = total_result.scalar_one()
-
-        used_result = await self.db.execute(
-            select(func.count(StoragePosition.id)).where(
-                StoragePosition.box_id.in_(box_ids_q),
-                StoragePosition.sample_id != None,  # noqa: E711
+        # Counters are trigger-maintained on freezer; a column select always
+        # reads the current row rather than a stale identity-map instance
+        result = await self.db.execute(
+            select(Freezer.total_positions, Freezer.occupied_positions).where(
+                Freezer.id == freezer_id
             )
         )
-        used_positions = used_result.scalar_one()
+        row = result.one_or_none()
+        total_positions, used_positions = row if row is not None else (0, 0)
 
         utilization_pct = (
             round(used_positions / total_positions * 100, 1)
@@ -966,18 +957,13 @@ class StorageService:
     ) -> None:
         """Check if the freezer containing this box has crossed the 85% threshold."""
         try:
-            # Walk up: box -> rack -> freezer
-            box_result = await self.db.execute(
-                select(StorageBox.rack_id).where(StorageBox.id == box_id)
-            )
-            rack_id = box_result.scalar_one_or_none()
-            if rack_id is None:
-                return
-
-            rack_result = await self.db.execute(
-                select(StorageRack.freezer_id).where(StorageRack.id == rack_id)
+            # Positions carry freezer_id directly; no box -> rack walk needed
+            pos_result = await self.db.execute(
+                select(StoragePosition.freezer_id)
+                .where(StoragePosition.box_id == box_id)
+                .limit(1)
             )
-            freezer_id = rack_result.scalar_one_or_none()
+            freezer_id = pos_result.scalar_one_or_none()
             if freezer_id is None:
                 return
 
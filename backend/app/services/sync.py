@@ -81,7 +81,8 @@ class SyncService:
         for mutation in mutations:
             mutation_type = mutation.get("type")
             entity_id = mutation.get("entity_id")
-            client_timestamp = mutation.get("timestamp")
+            # Parsed to a datetime by SyncMutation at the request boundary
+            client_dt = mutation.get("timestamp")
             payload = mutation.get("payload", {})
 
             if mutation_type not in SUPPORTED_MUTATIONS:
@@ -95,7 +96,7 @@ class SyncService:
                 result = await self._apply_mutation(
                     mutation_type=mutation_type,
                     entity_id=entity_id,
-                    client_timestamp=client_timestamp,
+                    client_dt=client_dt,
                     payload=payload,
                     user_id=user_id,
                 )
@@ -146,18 +147,11 @@ class SyncService:
         self,
         mutation_type: str,
         entity_id: str | None,
-        client_timestamp: str | None,
+        client_dt: datetime | None,
         payload: dict,
         user_id: uuid.UUID,
     ) -> dict:
         """Apply a single mutation. Returns status and optional conflict info."""
-        client_dt = None
-        if client_timestamp:
-            try:
-                client_dt = datetime.fromisoformat(client_timestamp)
-            except (ValueError, TypeError):
-                pass
-
         if mutation_type == "participant_checkin":
             return await self._apply_participant_checkin(
                 entity_id, client_dt, payload, user_id,
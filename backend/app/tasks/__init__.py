@@ -1 +1 @@
-from app.tasks import files, notifications, odk, reports  # noqa: F401
+from app.tasks import auth, files, notifications, odk, reports  # noqa: F401
@@ -0,0 +1,73 @@
+"""Celery tasks for authentication housekeeping."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+
+from app.celery_app import celery
+from app.database import async_session_factory
+from app.models.user import UserSession
+
+logger = logging.getLogger(__name__)
+
+# Expired sessions are kept briefly so recent logouts/expiries stay visible
+# while investigating a support request; audit_log is the permanent record.
+SESSION_RETENTION = timedelta(days=7)
+PURGE_BATCH_SIZE = 10_000
+
+
+async def _purge_expired_sessions() -> int:
+    """Delete sessions that expired before the retention cutoff, in batches.
+
+    Each batch commits separately so locks stay short and autovacuum can
+    reclaim space between batches. Revoked sessions are purged once they
+    have also expired.
+    """
+    cutoff = datetime.now(timezone.utc) - SESSION_RETENTION
+    purged = 0
+
+    async with async_session_factory() as db:
+        while True:
+            batch = (
+                select(UserSession.id)
+                .where(UserSession.expires_at < cutoff)
+                .limit(PURGE_BATCH_SIZE)
+                .scalar_subquery()
+            )
+            result = await db.execute(
+                delete(UserSession)
+                .where(UserSession.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            purged += result.rowcount
+            if result.rowcount < PURGE_BATCH_SIZE:
+                break
+
+    return purged
+
+
+@celery.task(
+    name="app.tasks.auth.purge_expired_sessions",
+    bind=True,
+    max_retries=1,
+)
+def purge_expired_sessions(self) -> dict:
+    """Celery beat task: delete long-expired user sessions."""
+    try:
+        purged = asyncio.get_event_loop().run_until_complete(
+            _purge_expired_sessions()
+        )
+        return {"status": "ok", "sessions_purged": purged}
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        try:
+            purged = loop.run_until_complete(_purge_expired_sessions())
+            return {"status": "ok", "sessions_purged": purged}
+        finally:
+            loop.close()
+    except Exception as exc:
+        logger.exception("Session purge failed")
+        self.retry(exc=exc, countdown=600)
@@ -0,0 +1,21 @@
+"""Participant.clinical_numeric path rendering."""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.participant import Participant
+
+
+def test_path_renders_as_index_matching_literal():
+    sql = str(
+        Participant.clinical_numeric("demographics", "age").compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "#>> '{demographics,age}'" in sql
+
+
+@pytest.mark.parametrize("part", ["a'b", "a,b", "a}b", 'a"b', ""])
+def test_non_identifier_path_part_is_rejected(part):
+    with pytest.raises(ValueError, match="Invalid clinical_data path part"):
+        Participant.clinical_numeric("demographics", part)
@@ -0,0 +1,43 @@
+"""Query builder filters on SMALLINT-coded status columns."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.enums import SAMPLE_STATUS_CODES, SampleStatus
+from app.models.sample import Sample
+from app.services.query_builder import QueryBuilderService
+
+
+def _where_sql(operator: str, value) -> str:
+    svc = QueryBuilderService(db=None)
+    query = svc._apply_filter(select(Sample.id), Sample.status, operator, value)
+    return str(
+        query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def test_contains_matches_enum_values_as_codes():
+    sql = _where_sql("contains", "STOR")
+    assert "ILIKE" not in sql.upper()
+    assert f"IN ({SAMPLE_STATUS_CODES[SampleStatus.STORED]})" in sql
+
+
+def test_starts_with_without_match_selects_nothing():
+    assert "false" in _where_sql("starts_with", "zzz")
+
+
+def test_eq_binds_status_code():
+    sql = _where_sql("eq", "stored")
+    assert f"= {SAMPLE_STATUS_CODES[SampleStatus.STORED]}" in sql
+
+
+@pytest.mark.parametrize(
+    ("operator", "value"),
+    [("eq", "not-a-status"), ("in", ["stored", "bogus"])],
+)
+def test_unknown_status_is_value_error(operator, value):
+    with pytest.raises(ValueError, match="Invalid value for status"):
+        _where_sql(operator, value)
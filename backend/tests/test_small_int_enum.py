@@ -0,0 +1,56 @@
+"""SmallIntEnum column type: round trips and statement caching."""
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select
+
+from app.models.base import SmallIntEnum
+from app.models.enums import SAMPLE_STATUS_CODES, SampleStatus
+
+
+def _sample_table() -> tuple[Table, MetaData]:
+    metadata = MetaData()
+    table = Table(
+        "sample_status_probe",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("status", SmallIntEnum(SampleStatus, SAMPLE_STATUS_CODES)),
+    )
+    return table, metadata
+
+
+def test_status_filter_goes_through_compiled_cache():
+    table, metadata = _sample_table()
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(table),
+            [
+                {"id": 1, "status": SampleStatus.STORED},
+                {"id": 2, "status": SampleStatus.REGISTERED},
+            ],
+        )
+        # Run twice so the second execution is served from the cache
+        for _ in range(2):
+            rows = conn.execute(
+                select(table).where(table.c.status == SampleStatus.STORED)
+            ).all()
+            assert rows == [(1, SampleStatus.STORED)]
+
+
+def test_stored_as_code_and_accepts_string_values():
+    table, metadata = _sample_table()
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        conn.execute(insert(table), [{"id": 1, "status": SampleStatus.STORED.value}])
+        raw = conn.exec_driver_sql("SELECT status FROM sample_status_probe").scalar_one()
+        assert raw == SAMPLE_STATUS_CODES[SampleStatus.STORED]
+        assert conn.execute(select(table.c.status)).scalar_one() is SampleStatus.STORED
+
+
+def test_equal_types_share_a_cache_key():
+    a = SmallIntEnum(SampleStatus, SAMPLE_STATUS_CODES)
+    b = SmallIntEnum(SampleStatus, SAMPLE_STATUS_CODES)
+    assert hash(a._static_cache_key) == hash(b._static_cache_key)